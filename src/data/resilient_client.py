@@ -13,6 +13,10 @@ import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
+from src.core.logging import get_logger
+
+logger = get_logger(__name__)
+
 
 class CircuitState(Enum):
     CLOSED = "closed"    # Normal operation
@@ -175,7 +179,7 @@ class ResilientHTTPClient:
         
         # Check circuit breaker
         if self._is_circuit_open():
-            print(f"[warn] Circuit breaker OPEN for {url}")
+            logger.warning("Circuit breaker OPEN for %s", url)
             # Fallback to stale cache if available
             if use_cache and fallback_to_stale and cache_key:
                 return self._get_stale_cache(cache_key)
@@ -183,7 +187,7 @@ class ResilientHTTPClient:
         
         # Make the request
         try:
-            print(f"[info] Fetching {url}")
+            logger.info("Fetching %s", url)
             response = self.session.get(url, params=params, timeout=self.timeout)
             response.raise_for_status()
             data = response.json()
@@ -196,20 +200,20 @@ class ResilientHTTPClient:
             return data
             
         except requests.exceptions.RequestException as e:
-            print(f"[warn] HTTP request failed for {url}: {e}")
+            logger.warning("HTTP request failed for %s: %s", url, e)
             self._record_failure()
             
             # Fallback to stale cache
             if use_cache and fallback_to_stale and cache_key:
                 stale_data = self._get_stale_cache(cache_key)
                 if stale_data:
-                    print(f"[info] Using stale cached data for {url}")
+                    logger.info("Using stale cached data for %s", url)
                     return stale_data
             
             return None
         
         except Exception as e:
-            print(f"[error] Unexpected error for {url}: {e}")
+            logger.error("Unexpected error for %s: %s", url, e)
             self._record_failure()
             return None
     
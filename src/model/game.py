@@ -12,7 +12,7 @@ class GameState(Enum):
     FINAL = auto()
 
 
-@dataclass
+@dataclass(slots=True)
 class TeamInfo:
     """Team information with extended metadata."""
     id: Optional[str]
@@ -27,7 +27,7 @@ class TeamInfo:
     division: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class GameSnapshot:
     """Unified game snapshot with full sport/league context."""
 
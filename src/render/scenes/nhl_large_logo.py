@@ -9,11 +9,26 @@ from PIL import Image, ImageDraw, ImageFont
 from datetime import datetime
 from typing import Optional
 
-from src.model.game import GameSnapshot
+from src.model.game import GameSnapshot, GameState
 from src.assets import logos
 from src.render.fonts import get_font_manager
 
 
+# Display text for the period names produced by the hockey timing config
+# (see HOCKEY_SPORT.timing.format_period_name). Resolved with a single dict
+# lookup on every frame; anything else falls through to the fuzzy matcher.
+_PERIOD_TEXT = {
+    "P1": "1ST",
+    "P2": "2ND",
+    "P3": "3RD",
+    "OT": "OT",
+    "SO": "SO",
+}
+
+# Power play marker colour
+_POWER_PLAY_COLOR = (255, 200, 0)
+
+
 def draw_nhl_large_logo(
     buffer: Image.Image,
     draw: ImageDraw.Draw,
@@ -132,8 +147,8 @@ def draw_nhl_large_logo(
     # Use team colors for scores if available, otherwise white
     draw.text((text_x, score_y), score_text, fill=(255, 255, 255), font=font_score)
 
-    # Add power play indicator if applicable (future enhancement)
-    # _draw_power_play_indicator(draw, snapshot, width, height)
+    # Mark the team on a power play
+    _draw_power_play_indicator(draw, snapshot, width, height, font_clock)
 
     # Add shots on goal if available (future enhancement)
     # _draw_shots_on_goal(draw, snapshot, width, height, font_small)
@@ -156,6 +171,10 @@ def _get_period_text(snapshot: GameSnapshot) -> str:
     if not period:
         return ""
 
+    period_text = _PERIOD_TEXT.get(period)
+    if period_text is not None:
+        return period_text
+
     # Handle hockey-specific periods
     period_lower = period.lower()
 
@@ -173,15 +192,30 @@ def _get_period_text(snapshot: GameSnapshot) -> str:
         return period.upper()
 
 
-def _draw_power_play_indicator(draw: ImageDraw.Draw, snapshot: GameSnapshot, width: int, height: int):
+def _draw_power_play_indicator(draw: ImageDraw.Draw, snapshot: GameSnapshot, width: int, height: int,
+                               font: ImageFont.FreeTypeFont):
     """
-    Draw power play indicator if a team has a power play.
+    Draw "PP" in the bottom corner of the team with a man advantage.
 
-    This is a placeholder for future implementation when we have
-    penalty/power play data in the game snapshot.
+    The side ("home"/"away") comes from sport_specific_data["power_play_team"],
+    set by the NHL client from the score API's situation code. Nothing is
+    drawn outside live play.
     """
-    # TODO: Implement when we have power play data
-    pass
+    if snapshot.state != GameState.LIVE:
+        return
+    side = snapshot.sport_specific_data.get("power_play_team")
+    if side not in ("home", "away"):
+        return
+
+    left, top, right, bottom = draw.textbbox((0, 0), "PP", font=font)
+    text_x = 1 - left if side == "away" else width - 1 - right
+    text_y = height - 1 - bottom
+    # Black backing keeps the text readable over the logo
+    draw.rectangle(
+        [(text_x + left - 1, text_y + top - 1), (text_x + right, text_y + bottom)],
+        fill=(0, 0, 0),
+    )
+    draw.text((text_x, text_y), "PP", fill=_POWER_PLAY_COLOR, font=font)
 
 
 def _draw_shots_on_goal(draw: ImageDraw.Draw, snapshot: GameSnapshot, width: int, height: int, font: ImageFont.FreeTypeFont):
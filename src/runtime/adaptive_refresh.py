@@ -27,12 +27,14 @@ class AdaptiveRefreshManager:
         # Network condition tracking
         self._request_count = 0
         self._failure_count = 0
-        self._last_failure_time = 0.0
+        # Event times below are time.monotonic() readings, so ages are
+        # unaffected by NTP steps or manual clock changes
+        self._last_failure_time: Optional[float] = None
         self._network_condition = NetworkCondition.EXCELLENT
         
         # Game state tracking
         self._last_game_snapshot: Optional[GameSnapshot] = None
-        self._last_score_change_time = 0.0
+        self._last_score_change_time: Optional[float] = None
         self._consecutive_no_change_count = 0
         
         # Adaptive factors
@@ -52,7 +54,7 @@ class AdaptiveRefreshManager:
         """Record a failed API request."""
         self._request_count += 1
         self._failure_count += 1
-        self._last_failure_time = time.time()
+        self._last_failure_time = time.monotonic()
         self._update_network_condition()
         
     def get_refresh_interval(
@@ -145,7 +147,10 @@ class AdaptiveRefreshManager:
             return
         
         failure_rate = self._failure_count / self._request_count
-        recent_failure = time.time() - self._last_failure_time < 300  # 5 minutes
+        recent_failure = (
+            self._last_failure_time is not None
+            and time.monotonic() - self._last_failure_time < 300  # 5 minutes
+        )
         
         if failure_rate == 0:
             self._network_condition = NetworkCondition.EXCELLENT
@@ -171,7 +176,7 @@ class AdaptiveRefreshManager:
         current_total_score = snapshot.home.score + snapshot.away.score
         
         if current_total_score != last_total_score:
-            self._last_score_change_time = time.time()
+            self._last_score_change_time = time.monotonic()
             self._consecutive_no_change_count = 0
         else:
             self._consecutive_no_change_count += 1
@@ -193,7 +198,10 @@ class AdaptiveRefreshManager:
     
     def _has_recent_score_change(self) -> bool:
         """Check if there was a recent score change."""
-        return time.time() - self._last_score_change_time < 120  # 2 minutes
+        return (
+            self._last_score_change_time is not None
+            and time.monotonic() - self._last_score_change_time < 120  # 2 minutes
+        )
     
     def _estimate_hours_since_game_end(self, snapshot: GameSnapshot, current_time: datetime) -> float:
         """Estimate hours since game ended (rough approximation)."""
@@ -223,13 +231,13 @@ class AdaptiveRefreshManager:
             "failure_count": self._failure_count,
             "failure_rate": round(failure_rate, 3),
             "consecutive_no_change": self._consecutive_no_change_count,
-            "last_score_change_ago_sec": time.time() - self._last_score_change_time if self._last_score_change_time > 0 else None,
+            "last_score_change_ago_sec": time.monotonic() - self._last_score_change_time if self._last_score_change_time is not None else None,
         }
     
     def reset_stats(self) -> None:
         """Reset network statistics (useful for testing or after config changes)."""
         self._request_count = 0
         self._failure_count = 0
-        self._last_failure_time = 0.0
+        self._last_failure_time = None
         self._network_condition = NetworkCondition.EXCELLENT
         self._consecutive_no_change_count = 0
\ No newline at end of file
@@ -1,10 +1,24 @@
 """Base classes for league-specific API clients."""
 
 from abc import ABC, abstractmethod
-from dataclasses import dataclass, asdict
-from datetime import date, datetime
-from typing import List, Optional, Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timezone
+from functools import cached_property, lru_cache
+from pathlib import Path
+from typing import Callable, List, Optional, Dict, Any, Tuple, Union
 import logging
+import os
+import time
+
+import msgspec
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    from ciso8601 import parse_datetime as _parse_datetime
+except ImportError:  # pragma: no cover
+    _parse_datetime = datetime.fromisoformat
 
 from ..models.league_config import LeagueConfig
 from ..models.sport_config import SportConfig, TimingConfig, ScoringConfig, TerminologyConfig
@@ -13,15 +27,183 @@ from src.model.game import GameSnapshot, GameState, TeamInfo
 logger = logging.getLogger(__name__)
 
 
+def parse_datetime(value: str) -> datetime:
+    """Parse a non-ISO timestamp; dateutil is only imported if this is ever needed."""
+    from dateutil.parser import parse
+
+    return parse(value)
+
+
+# API state strings that are not live play; anything else is treated as LIVE
+_STATE_MAP: Dict[str, GameState] = {
+    "pre": GameState.PRE,
+    "pregame": GameState.PRE,
+    "scheduled": GameState.PRE,
+    "post": GameState.FINAL,
+    "final": GameState.FINAL,
+    "finished": GameState.FINAL,
+    "complete": GameState.FINAL,
+}
+
+# Cached game states are stored by enum name; older caches used the value
+_STATE_BY_NAME: Dict[str, GameState] = {state.name: state for state in GameState}
+_STATE_BY_VALUE: Dict[int, GameState] = {state.value: state for state in GameState}
+
+# How long parsed games stay fresh in memory, by state; mixed entries use the shortest
+_TTL_BY_STATE: Dict[GameState, float] = {
+    GameState.PRE: 300,
+    GameState.LIVE: 10,
+    GameState.FINAL: 86400,
+}
+
+
+# Scheduled games about to start are polled more often so the switch to live shows up
+_STARTING_SOON_SECONDS = 3600
+_STARTING_SOON_TTL = 60
+
+# Nothing changes during an intermission; wait for it to end, up to this long
+_INTERMISSION_MAX_TTL = 300
+
+
+def _game_ttl(game: GameSnapshot) -> float:
+    """Freshness window for one game, from its state and what is happening in it."""
+    state = game.state
+    if state is GameState.LIVE:
+        intermission = game.sport_specific_data.get("intermission_seconds")
+        if intermission:
+            return max(_TTL_BY_STATE[state], min(intermission, _INTERMISSION_MAX_TTL))
+    elif state is GameState.PRE and 0 <= game.seconds_to_start < _STARTING_SOON_SECONDS:
+        return _STARTING_SOON_TTL
+    return _TTL_BY_STATE[state]
+
+
+def _update_countdowns(games: List[GameSnapshot]) -> None:
+    """Recompute the pregame countdowns of games reused from a cache."""
+    now_utc = now_local = None
+    for game in games:
+        if game.state is not GameState.PRE:
+            continue
+        start = game.start_time_local
+        if start.tzinfo is None:
+            now = now_local = now_local or datetime.now()
+        else:
+            now = now_utc = now_utc or datetime.now(timezone.utc)
+        game.seconds_to_start = max(0, int((start - now).total_seconds()))
+
+
+def games_ttl(games: List[GameSnapshot], default: float) -> float:
+    """Freshness window for a set of games: the shortest TTL among them."""
+    return min((_game_ttl(game) for game in games), default=default)
+
+
+@lru_cache(maxsize=1)
+def http_timeout() -> float:
+    """HTTP timeout in seconds for league API calls, read from the environment once."""
+    return float(os.getenv("HTTP_TIMEOUT", "10"))
+
+
+def _make_session() -> requests.Session:
+    """Build the HTTP session shared by league clients so polls reuse connections."""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=8,
+        # One transient upstream error should not cost a whole refresh cycle
+        max_retries=Retry(total=2, backoff_factor=0.2, status_forcelist=(500, 502, 503, 504)),
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+_SESSION = _make_session()
+
+
+class _GameWire(msgspec.Struct):
+    """On-disk representation of a cached game."""
+    event_id: str
+    start_time_local: str
+    state: Union[str, int]
+    home: TeamInfo
+    away: TeamInfo
+    current_period: int
+    period_name: str
+    display_clock: str
+    seconds_to_start: int = -1
+    status_detail: str = ""
+    sport_specific_data: Dict[str, Any] = {}
+
+
+class _CacheWire(msgspec.Struct):
+    """Cache file envelope; sport and league are stored once by code."""
+    sport_code: str
+    league_code: str
+    games: List[_GameWire]
+    # Upstream validators for conditional requests
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+
+_CACHE_ENCODER = msgspec.msgpack.Encoder(enc_hook=str)
+_CACHE_DECODER = msgspec.msgpack.Decoder(_CacheWire)
+# Caches written before the switch to msgpack; read-only migration path
+_LEGACY_CACHE_DECODER = msgspec.json.Decoder(List[_GameWire])
+
+# Dates a cached client keeps, most recently saved first; enough for
+# yesterday, today and tomorrow
+_CACHED_DATES = 3
+
+
+def _game_to_wire(game: GameSnapshot) -> _GameWire:
+    """Build the cache record for a game from direct attribute reads."""
+    return _GameWire(
+        event_id=game.event_id,
+        start_time_local=game.start_time_local.isoformat(),
+        state=game.state.name,  # Use enum name for serialization
+        home=game.home,
+        away=game.away,
+        current_period=game.current_period,
+        period_name=game.period_name,
+        display_clock=game.display_clock,
+        seconds_to_start=game.seconds_to_start,
+        status_detail=game.status_detail,
+        sport_specific_data=game.sport_specific_data,
+    )
+
+
 class LeagueClient(ABC):
     """Base class for league-specific API clients."""
 
     def __init__(self, league: LeagueConfig, sport: SportConfig):
         self.league = league
         self.sport = sport
-        self.effective_timing = league.get_effective_timing(sport.timing)
-        self.effective_scoring = league.get_effective_scoring(sport.scoring)
-        self.effective_terminology = league.get_effective_terminology(sport.terminology)
+        self._session = _SESSION
+
+    @cached_property
+    def effective_timing(self) -> TimingConfig:
+        """Sport timing with league overrides applied, merged on first use."""
+        return self.league.get_effective_timing(self.sport.timing)
+
+    @cached_property
+    def effective_scoring(self) -> ScoringConfig:
+        """Sport scoring with league overrides applied, merged on first use."""
+        return self.league.get_effective_scoring(self.sport.scoring)
+
+    @cached_property
+    def effective_terminology(self) -> TerminologyConfig:
+        """Sport terminology with league overrides applied, merged on first use."""
+        return self.league.get_effective_terminology(self.sport.terminology)
+
+    @cached_property
+    def _period_name_cache(self) -> Dict[Tuple[int, bool, bool], str]:
+        """Period names for the small set of periods seen in practice."""
+        timing = self.effective_timing
+        return {
+            (period, is_overtime, is_shootout): timing.format_period_name(period, is_overtime, is_shootout)
+            for period in range(1, 10)
+            for is_overtime in (False, True)
+            for is_shootout in (False, True)
+        }
 
     @abstractmethod
     def fetch_games(self, target_date: date) -> List[GameSnapshot]:
@@ -36,6 +218,24 @@ class LeagueClient(ABC):
         """
         pass
 
+    def fetch_games_batch(self, dates: List[date]) -> Dict[date, List[GameSnapshot]]:
+        """
+        Fetch games for several dates at once.
+
+        Requests run side by side over the shared session, so warming up
+        adjacent days costs about one round trip rather than one per date.
+
+        Args:
+            dates: Dates to fetch games for
+
+        Returns:
+            Dictionary mapping each date to its games
+        """
+        if len(dates) <= 1:
+            return {target_date: self.fetch_games(target_date) for target_date in dates}
+        with ThreadPoolExecutor(max_workers=min(len(dates), 4)) as pool:
+            return dict(zip(dates, pool.map(self.fetch_games, dates)))
+
     @abstractmethod
     def fetch_teams(self) -> List[Dict[str, Any]]:
         """
@@ -53,7 +253,10 @@ class LeagueClient(ABC):
 
     def format_period_name(self, period: int, is_overtime: bool = False, is_shootout: bool = False) -> str:
         """Format period name using effective timing configuration."""
-        return self.effective_timing.format_period_name(period, is_overtime, is_shootout)
+        period_name = self._period_name_cache.get((period, is_overtime, is_shootout))
+        if period_name is None:
+            period_name = self.effective_timing.format_period_name(period, is_overtime, is_shootout)
+        return period_name
 
     def get_start_term(self) -> str:
         """Get the game start term using effective terminology."""
@@ -69,13 +272,7 @@ class LeagueClient(ABC):
         Returns:
             GameState enum value
         """
-        state_lower = state_string.lower()
-        if state_lower in ["pre", "pregame", "scheduled"]:
-            return GameState.PRE
-        elif state_lower in ["post", "final", "finished", "complete"]:
-            return GameState.FINAL
-        else:
-            return GameState.LIVE
+        return _STATE_MAP.get(state_string.lower(), GameState.LIVE)
 
     def is_league_active(self, check_date: Optional[date] = None) -> bool:
         """Check if the league is currently in season."""
@@ -88,11 +285,16 @@ class CachedLeagueClient(LeagueClient):
     def __init__(self, league: LeagueConfig, sport: SportConfig, cache_dir: str = "cache"):
         super().__init__(league, sport)
         self.cache_dir = cache_dir
+        # Parsed games by cache key, with the monotonic time they go stale
+        self._mem_cache: Dict[str, Tuple[float, List[GameSnapshot]]] = {}
+        # Decoded teams by (id, score) so unchanged teams keep one instance across loads
+        self._team_cache: Dict[Tuple[Optional[str], int], TeamInfo] = {}
+        # ETag / Last-Modified of the response each cache key was built from
+        self._validators: Dict[str, Tuple[Optional[str], Optional[str]]] = {}
         self._setup_cache()
 
     def _setup_cache(self):
         """Setup cache directory structure."""
-        from pathlib import Path
         cache_path = Path(self.cache_dir) / self.league.code
         cache_path.mkdir(parents=True, exist_ok=True)
         self.cache_path = cache_path
@@ -103,106 +305,222 @@ class CachedLeagueClient(LeagueClient):
 
     def _load_from_cache(self, cache_key: str) -> Optional[List[GameSnapshot]]:
         """Load games from cache if available and not expired."""
-        import json
-        import time
-        from pathlib import Path
-
-        cache_file = self.cache_path / f"{cache_key}.json"
-        if not cache_file.exists():
-            return None
-
-        # Check cache age
-        cache_age = time.time() - cache_file.stat().st_mtime
-        if cache_age > self.league.api.cache_ttl_seconds:
-            return None
-
+        entry = self._mem_cache.get(cache_key)
+        if entry:
+            # The file was written or touched along with this entry; it is no fresher
+            return entry[1] if time.monotonic() < entry[0] else None
+
+        # One stat per candidate file; a missing file is the common miss
+        cache_file = self.cache_path / f"{cache_key}.mpk"
+        decoder = _CACHE_DECODER
         try:
-            with cache_file.open('r') as f:
-                data = json.load(f)
-                games = []
-                for game_data in data:
-                    # Parse datetime
-                    start_time = datetime.fromisoformat(game_data['start_time_local'])
-
-                    # Reconstruct team sides with extended fields
-                    home_data = game_data['home']
-                    home = TeamInfo(
-                        id=home_data.get('id'),
-                        name=home_data['name'],
-                        abbr=home_data['abbr'],
-                        score=home_data.get('score', 0),
-                        colors=home_data.get('colors', {}),
-                        logo_url=home_data.get('logo_url'),
-                        conference=home_data.get('conference'),
-                        division=home_data.get('division')
-                    )
-
-                    away_data = game_data['away']
-                    away = TeamInfo(
-                        id=away_data.get('id'),
-                        name=away_data['name'],
-                        abbr=away_data['abbr'],
-                        score=away_data.get('score', 0),
-                        colors=away_data.get('colors', {}),
-                        logo_url=away_data.get('logo_url'),
-                        conference=away_data.get('conference'),
-                        division=away_data.get('division')
-                    )
-
-                    # Reconstruct game state
-                    state = GameState[game_data['state']] if isinstance(game_data['state'], str) else GameState(game_data['state'])
-
-                    game = GameSnapshot(
-                        sport=self.sport,
-                        league=self.league,
-                        event_id=game_data['event_id'],
-                        start_time_local=start_time,
-                        state=state,
-                        home=home,
-                        away=away,
-                        current_period=game_data['current_period'],
-                        period_name=game_data['period_name'],
-                        display_clock=game_data['display_clock'],
-                        seconds_to_start=game_data.get('seconds_to_start', -1),
-                        status_detail=game_data.get('status_detail', ''),
-                        sport_specific_data=game_data.get('sport_specific_data', {})
-                    )
-                    games.append(game)
-                logger.debug(f"Loaded {len(games)} games from cache")
-                return games
+            cache_stat = cache_file.stat()
+        except FileNotFoundError:
+            cache_file = self.cache_path / f"{cache_key}.json"
+            decoder = _LEGACY_CACHE_DECODER
+            try:
+                cache_stat = cache_file.stat()
+            except FileNotFoundError:
+                return None
+
+        cache_age = time.time() - cache_stat.st_mtime
+        try:
+            payload = decoder.decode(cache_file.read_bytes())
+            if isinstance(payload, _CacheWire):
+                if payload.sport_code != self.sport.code or payload.league_code != self.league.code:
+                    logger.debug(f"Ignoring cache for {payload.league_code}/{payload.sport_code}")
+                    return None
+                wire_games = payload.games
+                self._validators[cache_key] = (payload.etag, payload.last_modified)
+            else:
+                wire_games = payload
+            # Bind per-loop constants once; this loop dominates large loads
+            sport, league, make_team = self.sport, self.league, self._make_team
+            games = []
+            for game_data in wire_games:
+                # Reconstruct game state (enum name, or value in older caches)
+                raw_state = game_data.state
+                state = _STATE_BY_NAME.get(raw_state) or _STATE_BY_VALUE.get(raw_state) or GameState.PRE
+
+                game = GameSnapshot(
+                    sport=sport,
+                    league=league,
+                    event_id=game_data.event_id,
+                    start_time_local=_parse_datetime(game_data.start_time_local),
+                    state=state,
+                    home=make_team(game_data.home),
+                    away=make_team(game_data.away),
+                    current_period=game_data.current_period,
+                    period_name=game_data.period_name,
+                    display_clock=game_data.display_clock,
+                    seconds_to_start=game_data.seconds_to_start,
+                    status_detail=game_data.status_detail,
+                    sport_specific_data=game_data.sport_specific_data
+                )
+                games.append(game)
+            # Age the memoized entry from the file so it expires with it, under the
+            # same state TTL as a saved entry. A stale file is still memoized so its
+            # validators let the next fetch be answered 304.
+            expires = time.monotonic() - cache_age + self._state_ttl(games)
+            self._mem_cache[cache_key] = (expires, games)
+            if time.monotonic() >= expires:
+                return None
+            logger.debug(f"Loaded {len(games)} games from cache")
+            return games
         except Exception as e:
             logger.warning(f"Failed to load cache: {e}")
             return None
 
-    def _save_to_cache(self, cache_key: str, games: List[GameSnapshot]):
-        """Save games to cache."""
-        import json
-        cache_file = self.cache_path / f"{cache_key}.json"
+    def _state_ttl(self, games: List[GameSnapshot]) -> float:
+        """Freshness window for a set of games: the shortest TTL of their states."""
+        return games_ttl(games, self.league.api.cache_ttl_seconds)
+
+    def _make_team(self, team: TeamInfo) -> TeamInfo:
+        """Return the interned instance for a decoded team, if one matches."""
+        key = (team.id, team.score)
+        cached = self._team_cache.get(key)
+        if cached is not None and cached == team:
+            return cached
+        self._team_cache[key] = team
+        return team
+
+    def _save_to_cache(self, cache_key: str, games: List[GameSnapshot],
+                       etag: Optional[str] = None, last_modified: Optional[str] = None):
+        """Save games to cache, along with the validators of the response they came from."""
+        # Re-inserted so the dict stays ordered from least to most recently saved
+        self._mem_cache.pop(cache_key, None)
+        self._mem_cache[cache_key] = (time.monotonic() + self._state_ttl(games), games)
+        self._validators[cache_key] = (etag, last_modified)
+        self._prune_dates()
+        cache_file = self.cache_path / f"{cache_key}.mpk"
 
         # Ensure cache directory exists
         self.cache_path.mkdir(parents=True, exist_ok=True)
 
         try:
-            data = []
-            for game in games:
-                game_dict = {
-                    'event_id': game.event_id,
-                    'start_time_local': game.start_time_local.isoformat(),
-                    'state': game.state.name,  # Use enum name for serialization
-                    'home': asdict(game.home),
-                    'away': asdict(game.away),
-                    'current_period': game.current_period,
-                    'period_name': game.period_name,
-                    'display_clock': game.display_clock,
-                    'seconds_to_start': game.seconds_to_start,
-                    'status_detail': game.status_detail,
-                    'sport_specific_data': game.sport_specific_data
-                }
-                data.append(game_dict)
-
-            with cache_file.open('w') as f:
-                json.dump(data, f, indent=2, default=str)
+            payload = _CacheWire(
+                sport_code=self.sport.code,
+                league_code=self.league.code,
+                games=[_game_to_wire(game) for game in games],
+                etag=etag,
+                last_modified=last_modified,
+            )
+            # Write to a temp file and rename so readers never see a partial cache
+            tmp_file = cache_file.with_suffix(".mpk.tmp")
+            with tmp_file.open("wb") as f:
+                f.write(_CACHE_ENCODER.encode(payload))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_file, cache_file)
 
             logger.debug(f"Saved {len(games)} games to cache")
         except Exception as e:
-            logger.warning(f"Failed to save cache: {e}")
\ No newline at end of file
+            logger.warning(f"Failed to save cache: {e}")
+
+    def _prune_dates(self) -> None:
+        """Forget all but the most recently saved dates, in memory and on disk."""
+        keep = list(self._mem_cache)[-_CACHED_DATES:]
+        for cache_key in list(self._mem_cache):
+            if cache_key not in keep:
+                self._mem_cache.pop(cache_key, None)
+        for cache_key in list(self._validators):
+            if cache_key not in keep:
+                self._validators.pop(cache_key, None)
+        try:
+            for cache_file in self.cache_path.glob("games_*"):
+                if cache_file.name.split(".", 1)[0] not in keep:
+                    cache_file.unlink(missing_ok=True)
+        except OSError as e:
+            logger.warning(f"Failed to prune cache: {e}")
+
+    def _refresh_cache(self, cache_key: str) -> None:
+        """Restart the TTL window of an unchanged cache entry without rewriting it."""
+        games = self._mem_cache[cache_key][1]
+        self._mem_cache[cache_key] = (time.monotonic() + self._state_ttl(games), games)
+        try:
+            os.utime(self.cache_path / f"{cache_key}.mpk")
+        except OSError:
+            pass
+
+    def _conditional_fetch(
+        self,
+        url: str,
+        etag: Optional[str],
+        last_modified: Optional[str],
+        params: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[int, bytes, Tuple[Optional[str], Optional[str]]]:
+        """
+        GET a URL, letting the server answer 304 if our copy is still current.
+
+        Args:
+            url: Endpoint to fetch
+            etag: ETag of the cached response, if any
+            last_modified: Last-Modified of the cached response, if any
+            params: Optional query parameters
+
+        Returns:
+            Tuple of (status code, body bytes, (etag, last_modified) of the response)
+        """
+        headers = dict(self.league.api.headers)
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+
+        response = self._session.get(url, params=params, headers=headers, timeout=http_timeout())
+        if response.status_code != 304:
+            response.raise_for_status()
+
+        validators = (
+            response.headers.get("ETag", etag),
+            response.headers.get("Last-Modified", last_modified),
+        )
+        return response.status_code, response.content, validators
+
+    def _fetch_games_cached(
+        self,
+        target_date: date,
+        url: str,
+        parse_body: Callable[[bytes], List[GameSnapshot]],
+        params: Optional[Dict[str, Any]] = None,
+    ) -> List[GameSnapshot]:
+        """
+        Default fetch path for cached clients.
+
+        Games are served from cache while fresh for their states. After that
+        a conditional GET is issued, and on 304 Not Modified the already-parsed
+        games are reused without downloading or parsing the body again.
+        Reused games have their pregame countdowns recomputed.
+
+        Args:
+            target_date: Date to fetch games for
+            url: Scoreboard endpoint for the date
+            parse_body: Turns a response body into games
+            params: Optional query parameters
+
+        Returns:
+            List of GameSnapshot objects
+        """
+        cache_key = self._get_cache_key(target_date)
+        games = self._load_from_cache(cache_key)
+        if games is not None:
+            _update_countdowns(games)
+            return games
+
+        # Only revalidate when there are parsed games to fall back on
+        etag, last_modified = (None, None)
+        if cache_key in self._mem_cache:
+            etag, last_modified = self._validators.get(cache_key, (None, None))
+
+        status, body, (etag, last_modified) = self._conditional_fetch(url, etag, last_modified, params)
+        if status == 304 and cache_key in self._mem_cache:
+            logger.debug(f"{self.league.code} games for {target_date} not modified")
+            games = self._mem_cache[cache_key][1]
+            # Before the TTL restarts, so a game about to start is polled sooner
+            _update_countdowns(games)
+            self._refresh_cache(cache_key)
+            return games
+
+        games = parse_body(body)
+        self._save_to_cache(cache_key, games, etag, last_modified)
+        return games
@@ -0,0 +1,12 @@
+"""JSON decoding shared by league API clients.
+
+``loads`` takes the raw response bytes, so no intermediate str is built.
+orjson is used when installed, otherwise msgspec (a required dependency).
+"""
+
+try:
+    from orjson import loads
+except ImportError:  # pragma: no cover
+    from msgspec.json import decode as loads
+
+__all__ = ["loads"]
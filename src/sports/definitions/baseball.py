@@ -1,5 +1,7 @@
 """Baseball sport configuration."""
 
+from types import MappingProxyType
+
 from ..models.sport_config import (
     SportConfig,
     TimingConfig,
@@ -26,11 +28,11 @@ BASEBALL_SPORT = SportConfig(
         overtime_name="Extra",
     ),
     scoring=ScoringConfig(
-        scoring_types={
+        scoring_types=MappingProxyType({
             "run": 1,
             "home_run": 1,  # Still scores 1 run per runner
             "grand_slam": 4,  # 4 runs total
-        },
+        }),
         default_score_value=1,
     ),
     terminology=TerminologyConfig(
@@ -39,7 +41,7 @@ BASEBALL_SPORT = SportConfig(
         game_end_term="Final",
         overtime_term="Extra Innings",
     ),
-    extensions={
+    extensions=MappingProxyType({
         "has_top_bottom": True,  # Top/Bottom of inning
         "has_outs": True,
         "outs_per_half_inning": 3,
@@ -49,5 +51,5 @@ BASEBALL_SPORT = SportConfig(
         "balls_for_walk": 4,
         "has_bases": True,
         "number_of_bases": 3,
-    },
+    }),
 )
\ No newline at end of file
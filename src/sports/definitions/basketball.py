@@ -1,5 +1,7 @@
 """Basketball sport configuration."""
 
+from types import MappingProxyType
+
 from ..models.sport_config import (
     SportConfig,
     TimingConfig,
@@ -26,14 +28,14 @@ BASKETBALL_SPORT = SportConfig(
         overtime_name="OT",
     ),
     scoring=ScoringConfig(
-        scoring_types={
+        scoring_types=MappingProxyType({
             "free_throw": 1,
             "field_goal": 2,
             "three_pointer": 3,
             "two_pointer": 2,
             "dunk": 2,
             "layup": 2,
-        },
+        }),
         default_score_value=2,
     ),
     terminology=TerminologyConfig(
@@ -42,12 +44,12 @@ BASKETBALL_SPORT = SportConfig(
         game_end_term="Final",
         overtime_term="Overtime",
     ),
-    extensions={
+    extensions=MappingProxyType({
         "has_shot_clock": True,
         "shot_clock_seconds": 24,
         "has_three_point_line": True,
         "has_free_throws": True,
         "max_fouls_before_ejection": 6,
         "team_fouls_for_bonus": 5,
-    },
+    }),
 )
\ No newline at end of file
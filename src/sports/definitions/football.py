@@ -1,5 +1,7 @@
 """American Football sport configuration."""
 
+from types import MappingProxyType
+
 from ..models.sport_config import (
     SportConfig,
     TimingConfig,
@@ -26,13 +28,13 @@ FOOTBALL_SPORT = SportConfig(
         overtime_name="OT",
     ),
     scoring=ScoringConfig(
-        scoring_types={
+        scoring_types=MappingProxyType({
             "touchdown": 6,
             "field_goal": 3,
             "safety": 2,
             "extra_point": 1,
             "two_point_conversion": 2,
-        },
+        }),
         default_score_value=6,
     ),
     terminology=TerminologyConfig(
@@ -41,12 +43,12 @@ FOOTBALL_SPORT = SportConfig(
         game_end_term="Final",
         overtime_term="Overtime",
     ),
-    extensions={
+    extensions=MappingProxyType({
         "has_downs": True,
         "downs_to_first": 4,
         "yards_to_first": 10,
         "has_play_clock": True,
         "play_clock_seconds": 40,
         "has_two_minute_warning": True,
-    },
+    }),
 )
\ No newline at end of file
@@ -1,5 +1,7 @@
 """Hockey sport configuration."""
 
+from types import MappingProxyType
+
 from ..models.sport_config import (
     SportConfig,
     TimingConfig,
@@ -26,12 +28,12 @@ HOCKEY_SPORT = SportConfig(
         overtime_name="OT",
     ),
     scoring=ScoringConfig(
-        scoring_types={
+        scoring_types=MappingProxyType({
             "goal": 1,
             "empty_net": 1,
             "penalty_shot": 1,
             "shootout_goal": 1,
-        },
+        }),
         default_score_value=1,
     ),
     terminology=TerminologyConfig(
@@ -40,10 +42,10 @@ HOCKEY_SPORT = SportConfig(
         game_end_term="Final",
         overtime_term="Overtime",
     ),
-    extensions={
+    extensions=MappingProxyType({
         "has_penalty_box": True,
         "has_power_play": True,
         "max_players_on_ice": 6,
         "goalie_pulled_situations": True,
-    },
+    }),
 )
\ No newline at end of file
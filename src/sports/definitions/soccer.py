@@ -1,5 +1,7 @@
 """Soccer/Football sport configuration."""
 
+from types import MappingProxyType
+
 from ..models.sport_config import (
     SportConfig,
     TimingConfig,
@@ -26,11 +28,11 @@ SOCCER_SPORT = SportConfig(
         overtime_name="Extra Time",
     ),
     scoring=ScoringConfig(
-        scoring_types={
+        scoring_types=MappingProxyType({
             "goal": 1,
             "penalty_kick": 1,
             "own_goal": 1,
-        },
+        }),
         default_score_value=1,
     ),
     terminology=TerminologyConfig(
@@ -39,11 +41,11 @@ SOCCER_SPORT = SportConfig(
         game_end_term="Full Time",
         overtime_term="Extra Time",
     ),
-    extensions={
+    extensions=MappingProxyType({
         "has_offside": True,
         "has_stoppage_time": True,
         "has_yellow_cards": True,
         "has_red_cards": True,
         "max_substitutions": 3,
-    },
+    }),
 )
\ No newline at end of file
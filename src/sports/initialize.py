@@ -8,12 +8,6 @@ from .definitions import (
     FOOTBALL_SPORT,
     BASEBALL_SPORT,
 )
-from .leagues import (
-    NHL_LEAGUE,
-    NHLClient,
-    WNBA_LEAGUE,
-    WNBAClient,
-)
 
 
 def initialize_sports_registry():
@@ -26,9 +20,13 @@ def initialize_sports_registry():
     registry.register_sport(FOOTBALL_SPORT)
     registry.register_sport(BASEBALL_SPORT)
 
-    # Register leagues with their clients
-    registry.register_league(NHL_LEAGUE, NHLClient)
-    registry.register_league(WNBA_LEAGUE, WNBAClient)
+    # Register leagues with their clients; each module is imported on first lookup
+    registry.register_league_lazy(
+        "nhl", "src.sports.leagues.nhl:NHLClient", config_path="src.sports.leagues.nhl:NHL_LEAGUE"
+    )
+    registry.register_league_lazy(
+        "wnba", "src.sports.leagues.wnba:WNBAClient", config_path="src.sports.leagues.wnba:WNBA_LEAGUE"
+    )
 
     # TODO: Add more leagues as they are implemented
     # registry.register_league(NBA_LEAGUE, NBAClient)
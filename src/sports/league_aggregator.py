@@ -3,12 +3,18 @@ League-based game aggregation and priority resolution system.
 """
 
 import os
+import threading
+import time
+from operator import itemgetter
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
 from dataclasses import dataclass
-from datetime import date, datetime, timedelta
-from typing import Dict, List, Optional, Tuple, Any
+from functools import partial
+from datetime import date, datetime
+from typing import AbstractSet, Dict, List, Optional, Tuple, Any
 from enum import Enum
 
 from src.model.game import GameSnapshot, GameState
+from .clients.base import CachedLeagueClient, games_ttl, http_timeout
 from .registry import registry
 
 
@@ -37,16 +43,42 @@ class LeagueAggregator:
         self.league_priorities = league_priorities
         self.enabled_leagues = enabled_leagues or league_priorities
 
+        # Base priority from league order (100, 99, 98, ...); first listing wins
+        self._base_priority: Dict[str, int] = {}
+        for index, league_code in enumerate(league_priorities):
+            self._base_priority.setdefault(league_code, 100 - index)
+
         # Initialize league clients from registry
         self.league_clients = {}
         self._initialize_league_clients()
 
+        # League fetches are blocking HTTP calls; run them side by side
+        self._pool = ThreadPoolExecutor(
+            max_workers=max(1, min(8, len(self.league_clients))),
+            thread_name_prefix="league-fetch",
+        )
+
         # Priority configuration
         self.priority_rules = LeaguePriorityRule(league_priorities=league_priorities)
 
+        # Fetched games by (league, date), with the monotonic time they go stale
+        self._games_cache: Dict[Tuple[str, date], Tuple[float, List[GameSnapshot]]] = {}
+
+        # Stale games are still served for this long while a background refresh runs
+        self._stale_window = float(os.getenv("STALE_WHILE_REVALIDATE_SECONDS", "60"))
+
+        # Fetches under way by (league, date); concurrent callers share one
+        self._inflight: Dict[Tuple[str, date], Future] = {}
+        self._inflight_lock = threading.Lock()
+
+        # How long a tick waits for league fetches before using cached games,
+        # and how long past their expiry those games may still be used
+        self._fetch_wait = float(os.getenv("LEAGUE_FETCH_WAIT_SECONDS", "2"))
+        self._max_stale = float(os.getenv("LEAGUE_MAX_STALE_SECONDS", "600"))
+
         # Conflict tracking
         self._last_conflict_resolution: Optional[Dict[str, Any]] = None
-        self._manual_override: Optional[Tuple[str, datetime]] = None  # (event_id, expires_at)
+        self._manual_override: Optional[Tuple[str, float]] = None  # (event_id, monotonic expiry)
 
     def _initialize_league_clients(self) -> None:
         """Initialize available league clients from registry."""
@@ -68,6 +100,137 @@ class LeagueAggregator:
             else:
                 print(f"[warning] No client implementation for league {league_code}")
 
+    def close(self) -> None:
+        """Shut down the fetch worker threads."""
+        self._pool.shutdown(wait=False)
+
+    def __del__(self):
+        """Release the worker threads if close() was never called."""
+        pool = getattr(self, "_pool", None)
+        if pool is not None:
+            pool.shutdown(wait=False)
+
+    def _fetch_all_games(self, target_date: date) -> Dict[str, List[GameSnapshot]]:
+        """
+        Fetch games from every league client concurrently.
+
+        A league with usable cached games (expired less than
+        LEAGUE_MAX_STALE_SECONDS ago) is waited on for at most
+        LEAGUE_FETCH_WAIT_SECONDS and then answered from that cache; its
+        fetch keeps running and later ticks join it instead of starting
+        another. A league with nothing cached, as on a cold start, is waited
+        on for up to the HTTP timeout so a slow link does not show an empty
+        slate while its fetch is still under way. Leagues that fail are
+        logged and left out. Results keep league order so ties in priority
+        resolve the same way on every tick.
+        """
+        futures = {
+            league_code: self._games_future(league_code, client, target_date)
+            for league_code, client in self.league_clients.items()
+        }
+
+        started = time.monotonic()
+        fallbacks = {league_code: self._fallback_games(league_code, target_date) for league_code in futures}
+        cold_wait = max(self._fetch_wait, http_timeout())
+        results = {}
+        for league_code, future in futures.items():
+            fallback = fallbacks[league_code]
+            wait = self._fetch_wait if fallback is not None else cold_wait
+            try:
+                results[league_code] = future.result(timeout=max(0.0, started + wait - time.monotonic()))
+            except FutureTimeoutError:
+                print(f"[warning] {league_code} fetch timed out; using last cached games")
+                results[league_code] = fallback or []
+            except Exception as e:
+                print(f"[error] Failed to fetch {league_code} games: {e}")
+        return results
+
+    def _fallback_games(self, league_code: str, target_date: date) -> Optional[List[GameSnapshot]]:
+        """Cached games for a league to show while its fetch is slow, if recent enough."""
+        entry = self._games_cache.get((league_code, target_date))
+        if entry and time.monotonic() < entry[0] + self._max_stale:
+            return entry[1]
+        return None
+
+    def _games_future(self, league_code: str, client, target_date: date) -> Future:
+        """
+        Return a future for a league's games, reusing a recent result for the same date.
+
+        Featured-game selection and the manual override lookup share one fetch
+        per tick. Entries expire by game state (live games quickly), never
+        later than the league's cache_ttl_seconds. An entry that expired less
+        than the stale window ago is returned as is while one background
+        refresh replaces it, so the display never waits on the network for it.
+
+        Clients that keep their own state-based cache (CachedLeagueClient)
+        are asked every time, so their games are never older than the
+        client's TTL; the aggregator's entry only backs a timed-out fetch.
+        Other clients' games are at most cache_ttl_seconds plus the stale
+        window old. Either way a timed-out fetch is answered with games at
+        most LEAGUE_MAX_STALE_SECONDS past their expiry.
+        """
+        entry = self._games_cache.get((league_code, target_date))
+        if entry and not isinstance(client, CachedLeagueClient):
+            now = time.monotonic()
+            if now < entry[0] + self._stale_window:
+                if now >= entry[0]:
+                    self._start_fetch(league_code, client, target_date, background=True)
+                cached = Future()
+                cached.set_result(entry[1])
+                return cached
+
+        return self._start_fetch(league_code, client, target_date)
+
+    def _start_fetch(self, league_code: str, client, target_date: date, background: bool = False) -> Future:
+        """
+        Start fetching a league's games on the pool, or join the fetch already under way.
+
+        Callers that arrive while the same league and date are being fetched
+        share that result (or its exception) instead of issuing another
+        request, so a stalled league API holds at most one worker per date.
+        Failures of background refreshes are logged, since no caller waits
+        on them.
+        """
+        key = (league_code, target_date)
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            if future is not None:
+                return future
+            future = self._inflight[key] = self._pool.submit(
+                self._fetch_and_store, league_code, client, target_date
+            )
+        if background:
+            future.add_done_callback(partial(self._report_refresh, league_code))
+        return future
+
+    def _report_refresh(self, league_code: str, future: Future) -> None:
+        """Log a failed background refresh."""
+        error = future.exception()
+        if error is not None:
+            print(f"[error] Failed to refresh {league_code} games: {error}")
+
+    def _fetch_and_store(self, league_code: str, client, target_date: date) -> List[GameSnapshot]:
+        """
+        Fetch a league's games and cache them until their state-based expiry.
+
+        The in-flight entry is cleared before the result is published, so a
+        caller woken by it never joins a finished (or failed) fetch.
+        """
+        key = (league_code, target_date)
+        try:
+            games = client.fetch_games(target_date)
+            now = time.monotonic()
+            ttl = client.league.api.cache_ttl_seconds
+            # Drop this league's other dates; only the current date is polled
+            for stale_key in list(self._games_cache):
+                if stale_key[0] == league_code and stale_key[1] != target_date:
+                    self._games_cache.pop(stale_key, None)
+            self._games_cache[key] = (now + min(games_ttl(games, ttl), ttl), games)
+            return games
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(key, None)
+
     def configure_priority_rules(
         self,
         live_game_boost: bool = True,
@@ -113,38 +276,37 @@ class LeagueAggregator:
             if override_game:
                 return override_game
 
-        # Fetch games from all enabled leagues
-        all_games = []
-        for league_code, client in self.league_clients.items():
-            try:
-                league_games = client.fetch_games(target_date)
-
-                # Calculate priority for each game
-                league_favorites = favorite_teams.get(league_code, [])
-                for game in league_games:
-                    priority = self._calculate_game_priority(
-                        game, league_code, now_local, league_favorites
-                    )
-                    # Store priority in the game object for later use
-                    game.sport_specific_data['priority_score'] = priority
-                    all_games.append(game)
-
-            except Exception as e:
-                print(f"[error] Failed to fetch {league_code} games: {e}")
-
-        if not all_games:
+        games_by_league = self._fetch_all_games(target_date)
+
+        # One league with at most one game has nothing to rank
+        if len(games_by_league) == 1:
+            (league_games,) = games_by_league.values()
+            if len(league_games) <= 1:
+                return league_games[0] if league_games else None
+
+        # Score each game from all enabled leagues
+        scored: List[Tuple[float, GameSnapshot]] = []
+        for league_code, league_games in games_by_league.items():
+            league_favorites = frozenset(favorite_teams.get(league_code, ()))
+            for game in league_games:
+                scored.append((
+                    self._calculate_game_priority(game, league_code, now_local, league_favorites),
+                    game,
+                ))
+
+        if not scored:
             return None
 
-        # Sort by priority and apply conflict resolution
-        all_games.sort(key=lambda g: g.sport_specific_data.get('priority_score', 0), reverse=True)
-        return self._apply_conflict_resolution(all_games, now_local)
+        # Only the top game is needed, so select it without sorting
+        chosen = self._apply_conflict_resolution(scored, now_local)
+        return chosen[1] if chosen else None
 
     def _calculate_game_priority(
         self,
         game: GameSnapshot,
         league_code: str,
         now: datetime,
-        favorite_teams: List[str]
+        favorite_teams: AbstractSet[str]
     ) -> float:
         """
         Calculate priority score for a game.
@@ -155,29 +317,21 @@ class LeagueAggregator:
         1. LIVE game with favorite team (1000+ points)
         2. League priority + other factors (0-200 points)
         """
-        # Base priority from league order (100, 99, 98, ...)
-        try:
-            base_priority = 100 - self.league_priorities.index(league_code)
-        except ValueError:
-            base_priority = 0
-
-        score = float(base_priority)
+        score = float(self._base_priority.get(league_code, 0))
+        is_live = game.state is GameState.LIVE
 
         # Check if this game has a favorite team
         has_favorite = False
         if self.priority_rules.favorite_team_boost:
-            home_name = game.home.name if hasattr(game.home, 'name') else str(game.home.abbr)
-            away_name = game.away.name if hasattr(game.away, 'name') else str(game.away.abbr)
-            home_abbr = game.home.abbr if hasattr(game.home, 'abbr') else ''
-            away_abbr = game.away.abbr if hasattr(game.away, 'abbr') else ''
+            home, away = game.home, game.away
 
             # Check both name and abbreviation for favorite match
-            if any(fav in [home_name, away_name, home_abbr, away_abbr] for fav in favorite_teams):
+            if not favorite_teams.isdisjoint((home.name, away.name, home.abbr, away.abbr)):
                 has_favorite = True
                 score += 30
 
         # LIVE game with favorite team gets massive boost (overrides league priority)
-        if game.state == GameState.LIVE:
+        if is_live:
             if has_favorite:
                 # Massive boost ensures LIVE + favorite always wins
                 score += 1000
@@ -186,7 +340,7 @@ class LeagueAggregator:
                 score += 50
 
         # Close game boost (only for live games)
-        if self.priority_rules.close_game_boost and game.state == GameState.LIVE:
+        if self.priority_rules.close_game_boost and is_live:
             score_diff = abs(game.home.score - game.away.score)
             if score_diff <= 5:  # Close game threshold
                 score += 20 - (score_diff * 2)  # More boost for closer games
@@ -209,29 +363,24 @@ class LeagueAggregator:
 
     def _apply_conflict_resolution(
         self,
-        games: List[GameSnapshot],
+        scored: List[Tuple[float, GameSnapshot]],
         now: datetime
-    ) -> Optional[GameSnapshot]:
-        """Apply conflict resolution strategy to select final game."""
-        if not games:
+    ) -> Optional[Tuple[float, GameSnapshot]]:
+        """Apply conflict resolution strategy to select the final (score, game) pair."""
+        if not scored:
             return None
 
-        if self.priority_rules.conflict_resolution == ConflictResolution.LIVE_FIRST:
-            # Find first live game
-            for game in games:
-                if game.state == GameState.LIVE:
-                    return game
+        if self.priority_rules.conflict_resolution is ConflictResolution.LIVE_FIRST:
+            # One pass: any live game outranks every non-live game, then by score
+            return max(scored, key=lambda entry: (entry[1].state is GameState.LIVE, entry[0]))
 
         # Default to highest priority game
-        return games[0]
+        return max(scored, key=itemgetter(0))
 
     def _is_manual_override_active(self) -> bool:
         """Check if manual override is currently active."""
-        if not self._manual_override:
-            return False
-
-        _, expires_at = self._manual_override
-        return datetime.now() < expires_at
+        # Monotonic time so clock adjustments cannot end or extend an override
+        return bool(self._manual_override) and time.monotonic() < self._manual_override[1]
 
     def _get_manual_override_game(self, target_date: date) -> Optional[GameSnapshot]:
         """Get the manually overridden game if it exists."""
@@ -241,20 +390,16 @@ class LeagueAggregator:
         event_id, _ = self._manual_override
 
         # Search for the game in all leagues
-        for league_code, client in self.league_clients.items():
-            try:
-                games = client.fetch_games(target_date)
-                for game in games:
-                    if game.event_id == event_id:
-                        return game
-            except Exception:
-                continue
+        for games in self._fetch_all_games(target_date).values():
+            for game in games:
+                if game.event_id == event_id:
+                    return game
 
         return None
 
     def set_manual_override(self, event_id: str, duration_hours: float = 4) -> None:
         """Set a manual override to display a specific game."""
-        expires_at = datetime.now() + timedelta(hours=duration_hours)
+        expires_at = time.monotonic() + duration_hours * 3600
         self._manual_override = (event_id, expires_at)
 
     def clear_manual_override(self) -> None:
@@ -268,14 +413,8 @@ class LeagueAggregator:
         Returns:
             Dictionary mapping league code to list of games
         """
-        games_by_league = {}
-
-        for league_code, client in self.league_clients.items():
-            try:
-                games = client.fetch_games(target_date)
-                games_by_league[league_code] = games
-            except Exception as e:
-                print(f"[error] Failed to fetch {league_code} games: {e}")
-                games_by_league[league_code] = []
-
-        return games_by_league
\ No newline at end of file
+        fetched = self._fetch_all_games(target_date)
+        return {
+            league_code: fetched.get(league_code, [])
+            for league_code in self.league_clients
+        }
\ No newline at end of file
@@ -1,11 +1,35 @@
 """League implementations."""
 
-from .nhl import NHL_LEAGUE, NHLClient
-from .wnba import WNBA_LEAGUE, WNBAClient
-
 __all__ = [
     "NHL_LEAGUE",
     "NHLClient",
     "WNBA_LEAGUE",
     "WNBAClient",
-]
\ No newline at end of file
+]
+
+# Exported names by defining submodule; imported on first access (PEP 562)
+_LAZY_EXPORTS = {
+    "NHL_LEAGUE": "nhl",
+    "NHLClient": "nhl",
+    "WNBA_LEAGUE": "wnba",
+    "WNBAClient": "wnba",
+}
+
+
+def __getattr__(name):
+    """Import a league's module when one of its exports is first read."""
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    from importlib import import_module
+
+    value = getattr(import_module(f".{module_name}", __name__), name)
+    # Later lookups find the name directly in the module namespace
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    """List lazy exports alongside the names already loaded."""
+    return sorted(list(globals()) + __all__)
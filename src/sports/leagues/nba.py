@@ -1,16 +1,48 @@
 """NBA league configuration and client."""
 
 from datetime import date, datetime
-from typing import List, Dict, Any, Optional
-from dateutil.parser import parse as parse_datetime
-import requests
-import os
+from types import MappingProxyType
+from typing import List, Dict, Any, Optional, Tuple
 
 from ..models.league_config import LeagueConfig, LeagueAPIConfig, LeagueSeason
-from ..clients.base import LeagueClient
+from ..clients.base import LeagueClient, http_timeout, parse_datetime
+from ..clients.serialization import loads
 from src.model.game import GameSnapshot, GameState, TeamInfo
 
 
+# ESPN status names that are not live play; anything else is treated as LIVE
+_STATUS_TO_STATE: Dict[str, GameState] = {
+    "STATUS_SCHEDULED": GameState.PRE,
+    "STATUS_POSTPONED": GameState.PRE,
+    "STATUS_FINAL": GameState.FINAL,
+    "STATUS_FINAL_OT": GameState.FINAL,
+}
+
+
+def _build_period_name(period: int, state: GameState) -> str:
+    """Format NBA period name."""
+    if state == GameState.PRE:
+        return ""
+    elif state == GameState.FINAL:
+        if period > 4:
+            ot_num = period - 4
+            return f"Final/OT{ot_num}" if ot_num > 1 else "Final/OT"
+        return "Final"
+    else:  # LIVE
+        if period > 4:
+            ot_num = period - 4
+            return f"OT{ot_num}" if ot_num > 1 else "OT"
+        return f"Q{period}"
+
+
+# Period names for regulation and the overtimes seen in practice
+_PERIOD_NAMES: Dict[Tuple[GameState, int], str] = {
+    (state, period): _build_period_name(period, state)
+    for state in GameState
+    for period in range(0, 11)
+}
+
+
 # NBA League Configuration (loaded from Supabase, this is a fallback)
 NBA_LEAGUE = LeagueConfig(
     name="National Basketball Association",
@@ -27,10 +59,10 @@ NBA_LEAGUE = LeagueConfig(
         cache_ttl_seconds=300,
     ),
     team_count=30,
-    conference_structure={
-        "Eastern": ["Atlantic", "Central", "Southeast"],
-        "Western": ["Northwest", "Pacific", "Southwest"],
-    },
+    conference_structure=MappingProxyType({
+        "Eastern": ("Atlantic", "Central", "Southeast"),
+        "Western": ("Northwest", "Pacific", "Southwest"),
+    }),
     # NBA uses 12-minute quarters (default for basketball)
     timing_overrides={
         "period_duration_minutes": 12,
@@ -53,16 +85,31 @@ class NBAClient(LeagueClient):
 
     def fetch_games(self, target_date: date) -> List[GameSnapshot]:
         """Fetch NBA games for the target date."""
+        return self.fetch_games_range(target_date, target_date)
+
+    def fetch_games_range(self, start_date: date, end_date: date) -> List[GameSnapshot]:
+        """
+        Fetch NBA games for an inclusive date range in one request.
+
+        Args:
+            start_date: First date to fetch games for
+            end_date: Last date to fetch games for
+
+        Returns:
+            List of GameSnapshot objects across the range
+        """
         games = []
-        datestr = target_date.strftime("%Y%m%d")
+        datestr = start_date.strftime("%Y%m%d")
+        if end_date != start_date:
+            # ESPN scoreboards accept a YYYYMMDD-YYYYMMDD range
+            datestr = f"{datestr}-{end_date.strftime('%Y%m%d')}"
         url = f"{self.league.api.base_url}/scoreboard"
         params = {"dates": datestr}
 
         try:
-            timeout = float(os.getenv("HTTP_TIMEOUT", "10"))
-            response = requests.get(url, params=params, timeout=timeout)
+            response = self._session.get(url, params=params, timeout=http_timeout())
             response.raise_for_status()
-            data = response.json()
+            data = loads(response.content)
 
             for event in data.get("events", []):
                 game_snapshot = self._parse_game(event)
@@ -83,7 +130,14 @@ class NBAClient(LeagueClient):
 
             # Parse game time
             game_date = event.get("date", "")
-            start_time = parse_datetime(game_date) if game_date else datetime.now()
+            if game_date:
+                try:
+                    start_time = datetime.fromisoformat(game_date.replace("Z", "+00:00"))
+                except ValueError:
+                    # Not ISO 8601; let dateutil work it out
+                    start_time = parse_datetime(game_date)
+            else:
+                start_time = datetime.now()
 
             # Parse game status
             status = event.get("status", {})
@@ -91,12 +145,7 @@ class NBAClient(LeagueClient):
             state_code = status_type.get("name", "STATUS_SCHEDULED")
 
             # Map ESPN status to our GameState
-            if state_code in ["STATUS_SCHEDULED", "STATUS_POSTPONED"]:
-                game_state = GameState.PRE
-            elif state_code in ["STATUS_FINAL", "STATUS_FINAL_OT"]:
-                game_state = GameState.FINAL
-            else:
-                game_state = GameState.LIVE
+            game_state = _STATUS_TO_STATE.get(state_code, GameState.LIVE)
 
             # Get period and clock
             period = status.get("period", 0)
@@ -147,7 +196,7 @@ class NBAClient(LeagueClient):
                 current_period=period,
                 period_name=period_name,
                 display_clock=display_clock,
-                seconds_to_start=-1 if game_state != GameState.PRE else int((start_time - datetime.now()).total_seconds()),
+                seconds_to_start=-1 if game_state != GameState.PRE else int((start_time - datetime.now(start_time.tzinfo)).total_seconds()),
                 status_detail=status_detail,
                 sport_specific_data={
                     "is_playoff": "playoff" in status_detail.lower() if status_detail else False,
@@ -161,18 +210,10 @@ class NBAClient(LeagueClient):
 
     def _format_period_name(self, period: int, state: GameState) -> str:
         """Format NBA period name."""
-        if state == GameState.PRE:
-            return ""
-        elif state == GameState.FINAL:
-            if period > 4:
-                ot_num = period - 4
-                return f"Final/OT{ot_num}" if ot_num > 1 else "Final/OT"
-            return "Final"
-        else:  # LIVE
-            if period > 4:
-                ot_num = period - 4
-                return f"OT{ot_num}" if ot_num > 1 else "OT"
-            return f"Q{period}"
+        period_name = _PERIOD_NAMES.get((state, period))
+        if period_name is None:
+            period_name = _build_period_name(period, state)
+        return period_name
 
     def fetch_teams(self) -> List[Dict[str, Any]]:
         """Fetch NBA team information."""
@@ -180,12 +221,15 @@ class NBAClient(LeagueClient):
         url = f"{self.league.api.base_url}/teams"
 
         try:
-            timeout = float(os.getenv("HTTP_TIMEOUT", "10"))
-            response = requests.get(url, timeout=timeout)
+            response = self._session.get(url, timeout=http_timeout())
             response.raise_for_status()
-            data = response.json()
+            data = loads(response.content)
 
-            for team_data in data.get("sports", [{}])[0].get("leagues", [{}])[0].get("teams", []):
+            # Teams live under sports[0].leagues[0]; any level may be missing
+            sports = data.get("sports")
+            leagues = sports[0].get("leagues") if sports else None
+            teams_data = (leagues[0].get("teams") if leagues else None) or ()
+            for team_data in teams_data:
                 team = team_data.get("team", {})
                 teams.append({
                     "id": team.get("id"),
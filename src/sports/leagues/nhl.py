@@ -1,15 +1,91 @@
 """NHL league configuration and client."""
 
-from datetime import date, datetime
-from typing import List, Dict, Any, Optional
-from dateutil.parser import parse as parse_datetime
-import requests
 import os
+import threading
+import time
+from collections import OrderedDict
+from datetime import date, datetime, timezone
+from functools import lru_cache
+from pathlib import Path
+from sys import intern
+from types import MappingProxyType
+from typing import Iterator, List, Dict, Any, Mapping, Optional, Tuple
 
 from ..models.league_config import LeagueConfig, LeagueAPIConfig, LeagueSeason
-from ..clients.base import LeagueClient
+from ..clients.base import LeagueClient, http_timeout, parse_datetime
+from ..clients.serialization import loads
+from src.core.logging import get_logger
 from src.model.game import GameSnapshot, GameState, TeamInfo
 
+logger = get_logger(__name__)
+
+# Parsed slates kept for re-served response bodies
+_PARSE_CACHE_SIZE = 8
+
+# Seconds between fallback writes while no game changes state; live scores
+# change on nearly every poll and the file usually lives on an SD card
+_FALLBACK_WRITE_INTERVAL = 60
+
+# Saved responses older than this are not shown; a live score from hours
+# ago would look current
+_FALLBACK_MAX_AGE = 30 * 60
+
+# Dates with a saved response; enough for yesterday, today and tomorrow
+_FALLBACK_DATES = 3
+
+# Shared stand-in for missing or null sub-objects; nothing is allocated per lookup
+_EMPTY: Mapping[str, Any] = MappingProxyType({})
+
+
+try:
+    # C parser; accepts the trailing Z without rewriting the string
+    from ciso8601 import parse_datetime as _parse_iso
+except ImportError:  # pragma: no cover
+    def _parse_iso(value: str) -> datetime:
+        """Parse an ISO 8601 timestamp with the stdlib parser."""
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+@lru_cache(maxsize=256)
+def _parse_start(value: str) -> datetime:
+    """Parse a game's start time; the same strings come back on every poll."""
+    try:
+        return _parse_iso(value)
+    except ValueError:
+        # Not ISO 8601; let dateutil work it out
+        return parse_datetime(value)
+
+
+# Score API gameState values; CRIT is the close of a live game
+_NHL_STATE_MAP: Dict[str, GameState] = {
+    "FUT": GameState.PRE,
+    "PRE": GameState.PRE,
+    "LIVE": GameState.LIVE,
+    "CRIT": GameState.LIVE,
+    "FINAL": GameState.FINAL,
+    "OFF": GameState.FINAL,
+}
+
+
+def _power_play_team(situation_code: Any) -> Optional[str]:
+    """
+    Side ("home"/"away") with a man advantage, from a score API situationCode.
+
+    The four digits are away goalie, away skaters, home skaters, home goalie.
+    Players on the ice are compared so a pulled goalie's extra attacker is
+    not read as a power play.
+    """
+    if not isinstance(situation_code, str) or len(situation_code) != 4 or not situation_code.isdigit():
+        return None
+    code = int(situation_code)
+    away = code // 1000 + code // 100 % 10
+    home = code // 10 % 10 + code % 10
+    if home > away:
+        return "home"
+    if away > home:
+        return "away"
+    return None
+
 
 # NHL League Configuration
 NHL_LEAGUE = LeagueConfig(
@@ -28,10 +104,10 @@ NHL_LEAGUE = LeagueConfig(
         cache_ttl_seconds=300,
     ),
     team_count=32,
-    conference_structure={
-        "Eastern": ["Metropolitan", "Atlantic"],
-        "Western": ["Central", "Pacific"],
-    },
+    conference_structure=MappingProxyType({
+        "Eastern": ("Metropolitan", "Atlantic"),
+        "Western": ("Central", "Pacific"),
+    }),
     # NHL specific timing overrides
     timing_overrides={
         "overtime_duration_minutes": 5,  # 3-on-3 OT in regular season
@@ -51,9 +127,17 @@ NHL_LEAGUE = LeagueConfig(
 class NHLClient(LeagueClient):
     """NHL-specific API client."""
 
-    def __init__(self, league_config, sport_config):
+    def __init__(self, league_config, sport_config, cache_dir: str = "cache"):
         """Initialize NHL client with league and sport configs."""
         super().__init__(league_config, sport_config)
+        # Last good score response per date, kept on disk so games can still
+        # be shown when the API is down, even across a restart
+        self._fallback_dir = Path(cache_dir) / league_config.code
+        # Per date: (game states, hash of body, monotonic write time) of the saved response
+        self._fallback_saved: Dict[str, Tuple[Tuple[GameState, ...], int, float]] = {}
+        # (date, hash of response body) -> games parsed from it, oldest first
+        self._parse_cache: "OrderedDict[Tuple[date, int], List[GameSnapshot]]" = OrderedDict()
+        self._parse_cache_lock = threading.Lock()
 
     def fetch_games(self, target_date: date) -> List[GameSnapshot]:
         """Fetch NHL games for the target date."""
@@ -62,67 +146,170 @@ class NHLClient(LeagueClient):
         url = f"{self.league.api.base_url}/score/{datestr}"
 
         try:
-            timeout = float(os.getenv("HTTP_TIMEOUT", "10"))
-            response = requests.get(url, timeout=timeout)
+            response = self._session.get(url, timeout=http_timeout())
             response.raise_for_status()
-            data = response.json()
-
-            # Current day's games
-            if "games" in data:
-                for game in data["games"]:
-                    game_snapshot = self._parse_game(game, target_date)
-                    if game_snapshot:
-                        games.append(game_snapshot)
-
-            # Previous day's games (if any still ongoing)
-            if "prevDate" in data and isinstance(data.get("gamesByDate"), list):
-                for date_games in data["gamesByDate"]:
-                    if date_games.get("date") == data["prevDate"]:
-                        for game in date_games.get("games", []):
-                            game_snapshot = self._parse_game(game, target_date)
-                            if game_snapshot:
-                                games.append(game_snapshot)
+            content = response.content
+            games = self._parse_response(content, target_date)
+            self._save_fallback(datestr, content, games)
 
         except Exception as e:
-            print(f"[error] Failed to fetch NHL games: {e}")
+            logger.error("Failed to fetch NHL games: %s", e)
+            games = self._load_fallback(target_date, datestr)
 
         return games
 
-    def _parse_game(self, game: dict, target_date: date) -> Optional[GameSnapshot]:
-        """Parse a single NHL game."""
+    def _save_fallback(self, datestr: str, content: bytes, games: List[GameSnapshot]) -> None:
+        """
+        Keep a score response on disk for outages.
+
+        The file is rewritten when any game's state changes, and otherwise
+        at most once per _FALLBACK_WRITE_INTERVAL; an unchanged body only has
+        its modification time refreshed, which is what _load_fallback ages.
+        """
+        states = tuple(game.state for game in games)
+        body_hash = hash(content)
+        now = time.monotonic()
+        fallback_file = self._fallback_dir / f"score_{datestr}.json"
+        saved = self._fallback_saved.get(datestr)
+        if saved is not None:
+            if now - saved[2] < _FALLBACK_WRITE_INTERVAL and (saved[1] == body_hash or saved[0] == states):
+                return
+            if saved[1] == body_hash:
+                try:
+                    os.utime(fallback_file)
+                except OSError:
+                    pass
+                self._fallback_saved[datestr] = (states, body_hash, now)
+                return
+
+        try:
+            self._fallback_dir.mkdir(parents=True, exist_ok=True)
+            # Write to a temp file and rename so readers never see a partial body
+            tmp_file = fallback_file.with_suffix(".json.tmp")
+            with tmp_file.open("wb") as f:
+                f.write(content)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_file, fallback_file)
+        except OSError as e:
+            logger.warning("Failed to save NHL fallback: %s", e)
+            return
+        self._fallback_saved[datestr] = (states, body_hash, now)
+        self._prune_fallbacks()
+
+    def _prune_fallbacks(self) -> None:
+        """Delete saved responses beyond the most recent dates or too old to show."""
         try:
+            saved = sorted(
+                ((path.stat().st_mtime, path.name, path) for path in self._fallback_dir.glob("score_*.json")),
+                reverse=True,
+            )
+            oldest_allowed = time.time() - _FALLBACK_MAX_AGE
+            for index, (mtime, _, path) in enumerate(saved):
+                if index >= _FALLBACK_DATES or mtime < oldest_allowed:
+                    path.unlink(missing_ok=True)
+                    self._fallback_saved.pop(path.stem[len("score_"):], None)
+        except OSError as e:
+            logger.warning("Failed to prune NHL fallbacks: %s", e)
+
+    def _load_fallback(self, target_date: date, datestr: str) -> List[GameSnapshot]:
+        """Parse the saved score response for the date, unless there is none or it is too old."""
+        fallback_file = self._fallback_dir / f"score_{datestr}.json"
+        try:
+            if time.time() - fallback_file.stat().st_mtime > _FALLBACK_MAX_AGE:
+                logger.info("Saved NHL games for %s are too old to show", datestr)
+                return []
+            games = self._parse_response(fallback_file.read_bytes(), target_date)
+        except Exception:
+            return []
+        logger.info("Using last saved NHL games for %s", datestr)
+        return games
+
+    def _parse_response(self, content: bytes, target_date: date) -> List[GameSnapshot]:
+        """Parse a score response, reusing the result for an unchanged body."""
+        key = (target_date, hash(content))
+        with self._parse_cache_lock:
+            games = self._parse_cache.get(key)
+            if games is not None:
+                self._parse_cache.move_to_end(key)
+                return list(games)
+
+        games = list(self._iter_games(loads(content), target_date))
+
+        # Pregame countdowns are computed from the clock, not the body
+        if not any(game.state == GameState.PRE for game in games):
+            with self._parse_cache_lock:
+                self._parse_cache[key] = games
+                if len(self._parse_cache) > _PARSE_CACHE_SIZE:
+                    self._parse_cache.popitem(last=False)
+        return list(games)
+
+    def _iter_games(self, data: Dict[str, Any], target_date: date) -> Iterator[GameSnapshot]:
+        """Yield parsed games from a score response, skipping unparseable ones."""
+        # Current day's games, then previous day's games (if any still ongoing)
+        day_games = data.get("games", [])
+        prev_games = []
+        if "prevDate" in data and isinstance(data.get("gamesByDate"), list):
+            games_by_date = {
+                date_games.get("date"): date_games.get("games", [])
+                for date_games in data["gamesByDate"]
+            }
+            prev_games = games_by_date.get(data["prevDate"], [])
+
+        # A game can be listed under both; parse each one once
+        seen_ids = set()
+        now_utc = datetime.now(timezone.utc)
+        # Loop-invariant lookup bound once for the whole slate
+        parse_game = self._parse_game
+        for game in (*day_games, *prev_games):
             game_id = game.get("id")
+            if game_id in seen_ids:
+                continue
+            seen_ids.add(game_id)
+            game_snapshot = parse_game(game, target_date, now_utc)
+            if game_snapshot:
+                yield game_snapshot
+
+    def _parse_game(self, game: dict, target_date: date,
+                    now_utc: Optional[datetime] = None) -> Optional[GameSnapshot]:
+        """Parse a single NHL game."""
+        try:
+            get = game.get
+            game_id = get("id")
             if not game_id:
                 return None
 
             # Get teams
-            home_team = game.get("homeTeam", {})
-            away_team = game.get("awayTeam", {})
+            home_team = get("homeTeam") or _EMPTY
+            away_team = get("awayTeam") or _EMPTY
 
             home = TeamInfo(
                 id=str(home_team.get("id", "")),
-                name=home_team.get("name", {}).get("default", ""),
-                abbr=home_team.get("abbrev", ""),
+                name=(home_team.get("name") or _EMPTY).get("default", ""),
+                abbr=intern(home_team.get("abbrev", "")),
                 score=int(home_team.get("score", 0)),
             )
 
             away = TeamInfo(
                 id=str(away_team.get("id", "")),
-                name=away_team.get("name", {}).get("default", ""),
-                abbr=away_team.get("abbrev", ""),
+                name=(away_team.get("name") or _EMPTY).get("default", ""),
+                abbr=intern(away_team.get("abbrev", "")),
                 score=int(away_team.get("score", 0)),
             )
 
             # Parse game state
-            game_state_str = game.get("gameState", "")
-            state = self.parse_game_state(game_state_str)
+            game_state_str = get("gameState", "")
+            state = _NHL_STATE_MAP.get(game_state_str) or self.parse_game_state(game_state_str)
 
             # Parse time information
-            start_time_str = game.get("startTimeUTC", "")
-            start_time_utc = parse_datetime(start_time_str) if start_time_str else datetime.now()
+            start_time_str = get("startTimeUTC", "")
+            if start_time_str:
+                start_time_utc = _parse_start(start_time_str)
+            else:
+                start_time_utc = datetime.now()
 
             # Parse period and clock
-            period_descriptor = game.get("periodDescriptor", {})
+            period_descriptor = get("periodDescriptor") or _EMPTY
             current_period = int(period_descriptor.get("number", 0))
             period_type = period_descriptor.get("periodType", "")
 
@@ -134,19 +321,25 @@ class NHLClient(LeagueClient):
             period_name = self.format_period_name(current_period, is_overtime, is_shootout)
 
             # Get clock
-            clock = game.get("clock", {})
+            clock = get("clock") or _EMPTY
             time_remaining = clock.get("timeRemaining", "")
             display_clock = time_remaining if time_remaining else "00:00"
+            # During an intermission the clock counts down the break instead
+            intermission_seconds = int(clock.get("secondsRemaining") or 0) if clock.get("inIntermission") else 0
+            power_play_team = _power_play_team((get("situation") or _EMPTY).get("situationCode"))
 
             # Calculate seconds to start for pregame
             seconds_to_start = -1
             if state == GameState.PRE:
-                now_utc = datetime.now(start_time_utc.tzinfo)
-                delta = start_time_utc - now_utc
+                if start_time_utc.tzinfo is None:
+                    now = datetime.now()
+                else:
+                    now = now_utc or datetime.now(timezone.utc)
+                delta = start_time_utc - now
                 seconds_to_start = max(0, int(delta.total_seconds()))
 
             # Get status detail
-            game_schedule_state = game.get("gameScheduleState", "")
+            game_schedule_state = get("gameScheduleState", "")
             if game_schedule_state:
                 status_detail = game_schedule_state
             else:
@@ -169,11 +362,13 @@ class NHLClient(LeagueClient):
                     "is_overtime": is_overtime,
                     "is_shootout": is_shootout,
                     "period_type": period_type,
+                    "intermission_seconds": intermission_seconds,
+                    "power_play_team": power_play_team,
                 },
             )
 
         except Exception as e:
-            print(f"[warn] Failed to parse NHL game: {e}")
+            logger.warning("Failed to parse NHL game: %s", e)
             return None
 
     def fetch_teams(self) -> List[Dict[str, Any]]:
@@ -183,20 +378,20 @@ class NHLClient(LeagueClient):
         url = "https://api.nhle.com/stats/rest/en/team"
 
         try:
-            timeout = float(os.getenv("HTTP_TIMEOUT", "10"))
-            response = requests.get(url, timeout=timeout)
+            response = self._session.get(url, timeout=http_timeout())
             response.raise_for_status()
-            data = response.json()
+            data = loads(response.content)
 
             # The stats API returns data in a 'data' field
             for team in data.get("data", []):
+                tri_code = intern(team.get("triCode", ""))
                 # The stats API uses different field names
                 teams.append({
                     "id": str(team.get("id", "")),
                     "name": team.get("fullName", ""),
-                    "abbreviation": team.get("triCode", ""),
+                    "abbreviation": tri_code,
                     "logo_url": self.league.logo_url_template.format(
-                        abbr=team.get("triCode", "").upper()
+                        abbr=tri_code.upper()
                     ) if self.league.logo_url_template else None,
                     # Conference and division not available in this endpoint
                     "conference": "",
@@ -204,6 +399,6 @@ class NHLClient(LeagueClient):
                 })
 
         except Exception as e:
-            print(f"[error] Failed to fetch NHL teams: {e}")
+            logger.error("Failed to fetch NHL teams: %s", e)
 
         return teams
\ No newline at end of file
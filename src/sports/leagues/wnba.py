@@ -1,15 +1,90 @@
 """WNBA league configuration and client."""
 
-from datetime import date, datetime
-from typing import List, Dict, Any, Optional
-from dateutil.parser import parse as parse_datetime
-import requests
-import os
+from datetime import date, datetime, timezone
+from types import MappingProxyType
+from typing import List, Dict, Any, Optional, Tuple, TypedDict
+import msgspec
+import time
 
 from ..models.league_config import LeagueConfig, LeagueAPIConfig, LeagueSeason
-from ..clients.base import LeagueClient
+from ..clients.base import CachedLeagueClient, http_timeout, parse_datetime
+from ..clients.serialization import loads
+from src.core.logging import get_logger
 from src.model.game import GameSnapshot, GameState, TeamInfo
 
+logger = get_logger(__name__)
+
+
+def _parse_team(competitor: dict, cache: Optional[Dict[Optional[str], TeamInfo]] = None) -> TeamInfo:
+    """Build a team from an ESPN competitor entry, reusing a cached one if unchanged."""
+    team = competitor.get("team", {})
+    team_id = team.get("id")
+    team_id = str(team_id) if team_id is not None else None
+    name = team.get("displayName") or team.get("name") or ""
+    abbr = team.get("abbreviation") or (team.get("shortDisplayName") or "").upper()
+    score = competitor.get("score")
+    score = int(score) if score else 0
+
+    if cache is not None:
+        cached = cache.get(team_id)
+        if cached is not None and cached.score == score and cached.name == name and cached.abbr == abbr:
+            return cached
+
+    parsed = TeamInfo(id=team_id, name=name, abbr=abbr, score=score)
+    if cache is not None:
+        cache[team_id] = parsed
+    return parsed
+
+
+# Only the scoreboard fields read by _parse_game are declared; everything else
+# in the payload (odds, leaders, venues, links, ...) is skipped while decoding
+# instead of being built into Python objects.
+class _Team(TypedDict, total=False):
+    id: Any
+    displayName: Any
+    name: Any
+    abbreviation: Any
+    shortDisplayName: Any
+
+
+class _Competitor(TypedDict, total=False):
+    homeAway: Any
+    score: Any
+    team: Optional[_Team]
+
+
+class _StatusType(TypedDict, total=False):
+    state: Any
+    detail: Any
+
+
+class _Status(TypedDict, total=False):
+    period: Any
+    displayClock: Any
+    type: Optional[_StatusType]
+
+
+class _Competition(TypedDict, total=False):
+    competitors: Optional[List[_Competitor]]
+    status: Optional[_Status]
+
+
+class _Event(TypedDict, total=False):
+    id: Any
+    date: Any
+    competitions: Optional[List[_Competition]]
+    broadcasts: Any
+
+
+class _Scoreboard(TypedDict, total=False):
+    events: Optional[List[_Event]]
+
+
+_SCOREBOARD_DECODER = msgspec.json.Decoder(_Scoreboard)
+
+# Team listings only change between seasons
+_TEAMS_TTL_SECONDS = 7 * 24 * 3600
+
 
 # WNBA League Configuration
 WNBA_LEAGUE = LeagueConfig(
@@ -27,10 +102,10 @@ WNBA_LEAGUE = LeagueConfig(
         cache_ttl_seconds=300,
     ),
     team_count=12,
-    conference_structure={
-        "Eastern": [],  # No divisions in WNBA
-        "Western": [],
-    },
+    conference_structure=MappingProxyType({
+        "Eastern": (),  # No divisions in WNBA
+        "Western": (),
+    }),
     # WNBA specific timing overrides
     timing_overrides={
         "period_duration_minutes": 10,  # 10-minute quarters vs NBA's 12
@@ -44,38 +119,51 @@ WNBA_LEAGUE = LeagueConfig(
 )
 
 
-class WNBAClient(LeagueClient):
+class WNBAClient(CachedLeagueClient):
     """WNBA-specific API client using ESPN."""
 
-    def __init__(self, league_config, sport_config):
+    def __init__(self, league_config, sport_config, cache_dir: str = "cache"):
         """Initialize WNBA client with league and sport configs."""
-        super().__init__(league_config, sport_config)
+        super().__init__(league_config, sport_config, cache_dir)
+        # Last parsed instance per team id, reused across polls while unchanged
+        self._teams_by_id: Dict[Optional[str], TeamInfo] = {}
+        # Team listing with the monotonic time it goes stale
+        self._teams: Optional[Tuple[float, List[Dict[str, Any]]]] = None
 
     def fetch_games(self, target_date: date) -> List[GameSnapshot]:
         """Fetch WNBA games for the target date."""
-        games = []
-        datestr = target_date.strftime("%Y%m%d")
         url = f"{self.league.api.base_url}/scoreboard"
-        params = {"dates": datestr}
+        params = {"dates": target_date.strftime("%Y%m%d")}
 
         try:
-            timeout = float(os.getenv("HTTP_TIMEOUT", "10"))
-            response = requests.get(url, params=params, timeout=timeout)
-            response.raise_for_status()
-            data = response.json()
-
-            for event in data.get("events", []):
-                game_snapshot = self._parse_game(event)
-                if game_snapshot:
-                    games.append(game_snapshot)
-
+            return self._fetch_games_cached(target_date, url, self._parse_scoreboard, params)
         except Exception as e:
-            print(f"[error] Failed to fetch WNBA games: {e}")
+            logger.error("Failed to fetch WNBA games: %s", e)
+            return []
 
+    def _parse_scoreboard(self, body: bytes) -> List[GameSnapshot]:
+        """Parse the games in an ESPN scoreboard response body."""
+        try:
+            data = _SCOREBOARD_DECODER.decode(body)
+        except msgspec.ValidationError:
+            # Unexpected shape somewhere; fall back to decoding everything
+            data = loads(body)
+
+        # Resolved once per response rather than once per event
+        regulation_periods = self.effective_timing.regulation_periods
+        now_utc = datetime.now(timezone.utc)
+        games = []
+        for event in data.get("events", []):
+            game_snapshot = self._parse_game(event, regulation_periods, now_utc)
+            if game_snapshot:
+                games.append(game_snapshot)
         return games
 
-    def _parse_game(self, event: dict) -> Optional[GameSnapshot]:
+    def _parse_game(self, event: dict, regulation_periods: Optional[int] = None,
+                    now_utc: Optional[datetime] = None) -> Optional[GameSnapshot]:
         """Parse a single WNBA game from ESPN data."""
+        if regulation_periods is None:
+            regulation_periods = self.effective_timing.regulation_periods
         try:
             event_id = event.get("id")
             if not event_id:
@@ -83,43 +171,47 @@ class WNBAClient(LeagueClient):
 
             # Get competition data
             competition = (event.get("competitions") or [{}])[0]
-            competitors = competition.get("competitors", [])
+            competitors = competition.get("competitors") or ()
 
-            # Find home and away teams
-            home_raw = next((c for c in competitors if c.get("homeAway") == "home"), None)
-            away_raw = next((c for c in competitors if c.get("homeAway") == "away"), None)
+            # Find home and away teams in one pass
+            home_raw = away_raw = None
+            for competitor in competitors:
+                home_away = competitor.get("homeAway")
+                if home_away == "home":
+                    home_raw = competitor
+                elif home_away == "away":
+                    away_raw = competitor
 
             if not home_raw or not away_raw:
                 return None
 
             # Parse teams
-            def parse_team(competitor: dict) -> TeamInfo:
-                team = competitor.get("team", {})
-                return TeamInfo(
-                    id=str(team.get("id")) if team.get("id") is not None else None,
-                    name=team.get("displayName") or team.get("name") or "",
-                    abbr=team.get("abbreviation") or (team.get("shortDisplayName") or "").upper(),
-                    score=int(competitor.get("score") or 0),
-                )
-
-            home = parse_team(home_raw)
-            away = parse_team(away_raw)
+            home = _parse_team(home_raw, self._teams_by_id)
+            away = _parse_team(away_raw, self._teams_by_id)
 
             # Parse game state
-            status = competition.get("status", {}).get("type", {})
-            state_str = (status.get("state") or "").lower()
+            status = competition.get("status") or {}
+            status_type = status.get("type") or {}
+            state_str = (status_type.get("state") or "").lower()
             state = self.parse_game_state(state_str)
 
             # Parse time information
             start_time_iso = event.get("date")
-            start_time_utc = parse_datetime(start_time_iso) if start_time_iso else datetime.now()
+            if start_time_iso:
+                try:
+                    start_time_utc = datetime.fromisoformat(start_time_iso.replace("Z", "+00:00"))
+                except ValueError:
+                    # Not ISO 8601; let dateutil work it out
+                    start_time_utc = parse_datetime(start_time_iso)
+            else:
+                start_time_utc = datetime.now()
 
             # Parse period and clock
-            period = int(competition.get("status", {}).get("period") or 0)
-            display_clock = competition.get("status", {}).get("displayClock") or ""
+            period = int(status.get("period") or 0)
+            display_clock = status.get("displayClock") or ""
 
             # Determine if overtime
-            is_overtime = period > self.effective_timing.regulation_periods
+            is_overtime = period > regulation_periods
 
             # Get period name using sport configuration
             period_name = self.format_period_name(period, is_overtime)
@@ -127,12 +219,15 @@ class WNBAClient(LeagueClient):
             # Calculate seconds to start for pregame
             seconds_to_start = -1
             if state == GameState.PRE:
-                now_utc = datetime.now(start_time_utc.tzinfo)
-                delta = start_time_utc - now_utc
+                if start_time_utc.tzinfo is None:
+                    now = datetime.now()
+                else:
+                    now = now_utc or datetime.now(timezone.utc)
+                delta = start_time_utc - now
                 seconds_to_start = max(0, int(delta.total_seconds()))
 
             # Get status detail
-            status_detail = status.get("detail") or ""
+            status_detail = status_type.get("detail") or ""
             if not status_detail:
                 status_detail = period_name
 
@@ -156,21 +251,27 @@ class WNBAClient(LeagueClient):
             )
 
         except Exception as e:
-            print(f"[warn] Failed to parse WNBA game: {e}")
+            logger.warning("Failed to parse WNBA game: %s", e)
             return None
 
     def fetch_teams(self) -> List[Dict[str, Any]]:
         """Fetch WNBA team information from ESPN."""
+        if self._teams and self._teams[0] > time.monotonic():
+            return self._teams[1]
+
         teams = []
         url = f"{self.league.api.base_url}/teams"
 
         try:
-            timeout = float(os.getenv("HTTP_TIMEOUT", "10"))
-            response = requests.get(url, timeout=timeout)
+            response = self._session.get(url, timeout=http_timeout())
             response.raise_for_status()
-            data = response.json()
+            data = loads(response.content)
 
-            for team_data in data.get("sports", [{}])[0].get("leagues", [{}])[0].get("teams", []):
+            # Teams live under sports[0].leagues[0]; any level may be missing
+            sports = data.get("sports")
+            leagues = sports[0].get("leagues") if sports else None
+            teams_data = (leagues[0].get("teams") if leagues else None) or ()
+            for team_data in teams_data:
                 team = team_data.get("team", {})
                 teams.append({
                     "id": str(team.get("id", "")),
@@ -185,6 +286,8 @@ class WNBAClient(LeagueClient):
                 })
 
         except Exception as e:
-            print(f"[error] Failed to fetch WNBA teams: {e}")
+            logger.error("Failed to fetch WNBA teams: %s", e)
+            return teams
 
+        self._teams = (time.monotonic() + _TEAMS_TTL_SECONDS, teams)
         return teams
\ No newline at end of file
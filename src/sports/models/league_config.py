@@ -1,13 +1,13 @@
 """League configuration models."""
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from datetime import date
-from typing import Optional, Dict, Any, List, Type
+from typing import Optional, Dict, Any, Mapping, Sequence, Type
 
 from .sport_config import TimingConfig, ScoringConfig, TerminologyConfig
 
 
-@dataclass
+@dataclass(slots=True)
 class LeagueAPIConfig:
     """League-specific API configuration."""
     base_url: str
@@ -17,7 +17,7 @@ class LeagueAPIConfig:
     headers: Dict[str, str] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class LeagueSeason:
     """League season information."""
     start_date: date
@@ -36,7 +36,7 @@ class LeagueSeason:
         return self.playoff_start <= check_date <= self.end_date
 
 
-@dataclass
+@dataclass(slots=True)
 class LeagueConfig:
     """League-specific configuration with sport overrides."""
     name: str
@@ -56,48 +56,46 @@ class LeagueConfig:
 
     # League-specific data
     team_count: int = 0
-    conference_structure: Optional[Dict[str, List[str]]] = None
+    conference_structure: Optional[Mapping[str, Sequence[str]]] = None
 
     # Asset information
     team_assets_url: Optional[str] = None
     logo_url_template: Optional[str] = None  # e.g., "https://example.com/logos/{team_id}.svg"
 
+    # Effective configs already merged, by (kind, id of the frozen sport config)
+    _effective_cache: Dict[Any, Any] = field(default_factory=dict, init=False, repr=False, compare=False)
+
+    def _merge_overrides(self, kind: str, sport_value: Any, overrides: Optional[Dict[str, Any]]) -> Any:
+        """Apply league overrides to a frozen sport config, memoized per sport config."""
+        if not overrides:
+            return sport_value
+
+        # Keyed by identity: hashing a config walks every field, and some
+        # (scoring with a dict field) are unhashable. The entry holds the
+        # sport config itself so a recycled id can never match.
+        key = (kind, id(sport_value))
+        entry = self._effective_cache.get(key)
+        if entry is not None and entry[0] is sport_value:
+            return entry[1]
+
+        fields = sport_value.__dataclass_fields__
+        effective = replace(sport_value, **{
+            k: v for k, v in overrides.items() if k in fields
+        })
+        self._effective_cache[key] = (sport_value, effective)
+        return effective
+
     def get_effective_timing(self, sport_timing: TimingConfig) -> TimingConfig:
         """Merge sport timing with league overrides."""
-        if not self.timing_overrides:
-            return sport_timing
-
-        # Create copy and apply overrides
-        import copy
-        effective = copy.deepcopy(sport_timing)
-        for key, value in self.timing_overrides.items():
-            if hasattr(effective, key):
-                setattr(effective, key, value)
-        return effective
+        return self._merge_overrides("timing", sport_timing, self.timing_overrides)
 
     def get_effective_scoring(self, sport_scoring: ScoringConfig) -> ScoringConfig:
         """Merge sport scoring with league overrides."""
-        if not self.scoring_overrides:
-            return sport_scoring
-
-        import copy
-        effective = copy.deepcopy(sport_scoring)
-        for key, value in self.scoring_overrides.items():
-            if hasattr(effective, key):
-                setattr(effective, key, value)
-        return effective
+        return self._merge_overrides("scoring", sport_scoring, self.scoring_overrides)
 
     def get_effective_terminology(self, sport_terminology: TerminologyConfig) -> TerminologyConfig:
         """Merge sport terminology with league overrides."""
-        if not self.terminology_overrides:
-            return sport_terminology
-
-        import copy
-        effective = copy.deepcopy(sport_terminology)
-        for key, value in self.terminology_overrides.items():
-            if hasattr(effective, key):
-                setattr(effective, key, value)
-        return effective
+        return self._merge_overrides("terminology", sport_terminology, self.terminology_overrides)
 
     def is_active(self, check_date: Optional[date] = None) -> bool:
         """Check if league is currently active."""
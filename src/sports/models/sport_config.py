@@ -1,8 +1,8 @@
 """Sport configuration models."""
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from enum import Enum
-from typing import Optional, Dict, Any
+from typing import Optional, Any, Mapping
 
 
 class PeriodType(Enum):
@@ -21,7 +21,7 @@ class ClockDirection(Enum):
     NONE = "none"        # Baseball
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TimingConfig:
     """Sport-level timing configuration."""
     period_type: PeriodType
@@ -38,6 +38,15 @@ class TimingConfig:
     period_name_format: str = "{type}{number}"  # e.g., "Q{number}", "P{number}"
     overtime_name: str = "OT"
 
+    # period_name_format with the type letter filled in, e.g. "Q{number}"
+    _regular_template: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        """Fill in the period type letter once instead of on every format call."""
+        # Q for quarter, P for period, etc.; plain strings are accepted as well
+        type_char = getattr(self.period_type, "value", self.period_type)[:1].upper()
+        object.__setattr__(self, "_regular_template", self.period_name_format.replace("{type}", type_char))
+
     def format_period_name(self, period_number: int, is_overtime: bool = False, is_shootout: bool = False) -> str:
         """Format period name based on configuration."""
         if is_shootout:
@@ -51,16 +60,15 @@ class TimingConfig:
                 return self.overtime_name
         elif period_number <= self.regulation_periods:
             # Regular period
-            type_char = self.period_type.value[0].upper()  # Q for quarter, P for period, etc.
-            return self.period_name_format.replace("{type}", type_char).replace("{number}", str(period_number))
+            return self._regular_template.replace("{number}", str(period_number))
         else:
             return f"Period {period_number}"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ScoringConfig:
     """Sport-level scoring configuration."""
-    scoring_types: Dict[str, int]  # e.g., {"goal": 1, "safety": 2, "touchdown": 6}
+    scoring_types: Mapping[str, int]  # e.g., {"goal": 1, "safety": 2, "touchdown": 6}
     default_score_value: int = 1
 
     def get_score_value(self, score_type: str) -> int:
@@ -68,7 +76,7 @@ class ScoringConfig:
         return self.scoring_types.get(score_type, self.default_score_value)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TerminologyConfig:
     """Sport-specific terminology."""
     game_start_term: str  # "Tip", "Drop", "Kickoff", "First Pitch"
@@ -87,7 +95,7 @@ class TerminologyConfig:
         return self.game_start_term
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SportConfig:
     """Complete sport configuration."""
     name: str
@@ -97,13 +105,13 @@ class SportConfig:
     terminology: TerminologyConfig
 
     # Optional sport-specific extensions
-    extensions: Dict[str, Any] = field(default_factory=dict)
+    extensions: Mapping[str, Any] = field(default_factory=dict)
 
     def __post_init__(self):
         """Validate configuration."""
         if self.timing.has_overtime and self.timing.overtime_duration_minutes is None:
             # Default overtime duration if not specified
-            self.timing.overtime_duration_minutes = 5.0
+            object.__setattr__(self, "timing", replace(self.timing, overtime_duration_minutes=5.0))
 
     def get_period_name(self, period: int, is_overtime: bool = False, is_shootout: bool = False) -> str:
         """Get display name for a period."""
@@ -1,6 +1,7 @@
 """Central registry for sports and leagues."""
 
-from typing import Dict, Optional, Type, List
+import importlib
+from typing import Any, Dict, Optional, Type, List, Tuple
 from .models.sport_config import SportConfig
 from .models.league_config import LeagueConfig
 
@@ -12,6 +13,8 @@ class SportRegistry:
         self._sports: Dict[str, SportConfig] = {}
         self._leagues: Dict[str, LeagueConfig] = {}
         self._league_clients: Dict[str, Type['LeagueClient']] = {}
+        # Leagues registered by "module:attribute" path, imported on first use
+        self._lazy_leagues: Dict[str, Tuple[str, Optional[str]]] = {}
 
     def register_sport(self, sport: SportConfig) -> None:
         """Register a sport configuration."""
@@ -22,24 +25,57 @@ class SportRegistry:
         if league.sport_code not in self._sports:
             raise ValueError(f"Sport {league.sport_code} not registered. Register sport before league.")
 
+        # An explicit registration replaces any pending lazy one
+        self._lazy_leagues.pop(league.code, None)
         self._leagues[league.code] = league
         if client_class:
             self._league_clients[league.code] = client_class
 
+    def register_league_lazy(self, league_code: str, client_path: Optional[str], config_path: str) -> None:
+        """
+        Register a league by import path so its module loads only when needed.
+
+        Args:
+            league_code: League code the paths provide
+            client_path: "module:attribute" path of the API client class, if any
+            config_path: "module:attribute" path of the LeagueConfig
+        """
+        self._lazy_leagues[league_code] = (config_path, client_path)
+
+    def _resolve_lazy(self, league_code: str) -> None:
+        """Import and register a lazily registered league, if pending."""
+        paths = self._lazy_leagues.pop(league_code, None)
+        if paths is None:
+            return
+        config_path, client_path = paths
+        league = _import_path(config_path)
+        client_class = _import_path(client_path) if client_path else None
+        self.register_league(league, client_class)
+
+    def _resolve_all_lazy(self) -> None:
+        """Import every lazily registered league."""
+        for league_code in list(self._lazy_leagues):
+            self._resolve_lazy(league_code)
+
     def get_sport(self, sport_code: str) -> Optional[SportConfig]:
         """Get sport configuration."""
         return self._sports.get(sport_code)
 
     def get_league(self, league_code: str) -> Optional[LeagueConfig]:
         """Get league configuration."""
+        if league_code in self._lazy_leagues:
+            self._resolve_lazy(league_code)
         return self._leagues.get(league_code)
 
     def get_league_client_class(self, league_code: str) -> Optional[Type['LeagueClient']]:
         """Get league API client class."""
+        if league_code in self._lazy_leagues:
+            self._resolve_lazy(league_code)
         return self._league_clients.get(league_code)
 
     def get_leagues_for_sport(self, sport_code: str) -> List[LeagueConfig]:
         """Get all leagues for a sport."""
+        self._resolve_all_lazy()
         return [
             league for league in self._leagues.values()
             if league.sport_code == sport_code
@@ -47,6 +83,8 @@ class SportRegistry:
 
     def get_enabled_leagues(self, enabled_list: List[str]) -> List[LeagueConfig]:
         """Get leagues that are in the enabled list."""
+        for code in enabled_list:
+            self._resolve_lazy(code)
         return [
             self._leagues[code] for code in enabled_list
             if code in self._leagues
@@ -58,6 +96,7 @@ class SportRegistry:
 
     def list_leagues(self) -> List[LeagueConfig]:
         """List all registered leagues."""
+        self._resolve_all_lazy()
         return list(self._leagues.values())
 
     def get_sport_for_league(self, league_code: str) -> Optional[SportConfig]:
@@ -68,6 +107,12 @@ class SportRegistry:
         return None
 
 
+def _import_path(path: str) -> Any:
+    """Import the attribute named by a "module:attribute" path."""
+    module_name, _, attribute = path.partition(":")
+    return getattr(importlib.import_module(module_name), attribute)
+
+
 # Global registry instance
 registry = SportRegistry()
 
@@ -0,0 +1,45 @@
+"""Unit tests for the adaptive refresh manager."""
+
+import unittest
+from unittest.mock import patch
+
+from src.config.types import RefreshConfig
+from src.runtime.adaptive_refresh import AdaptiveRefreshManager, NetworkCondition
+
+
+class TestAdaptiveRefreshTiming(unittest.TestCase):
+    """Test that event ages are measured on the monotonic clock."""
+
+    def setUp(self):
+        """Set up a manager with default refresh intervals."""
+        self.manager = AdaptiveRefreshManager(RefreshConfig())
+
+    def test_no_recent_failure_right_after_boot(self):
+        """Test that a low monotonic reading is not mistaken for a recent failure."""
+        with patch("src.runtime.adaptive_refresh.time.monotonic", return_value=10.0):
+            for _ in range(3):
+                self.manager.record_request_success()
+
+        self.assertEqual(self.manager._network_condition, NetworkCondition.EXCELLENT)
+        self.assertFalse(self.manager._has_recent_score_change())
+        self.assertIsNone(self.manager.get_status()["last_score_change_ago_sec"])
+
+    def test_recent_failure_ignores_wall_clock_steps(self):
+        """Test that a failure stays recent when the wall clock jumps ahead."""
+        with patch("src.runtime.adaptive_refresh.time.monotonic", return_value=1000.0):
+            self.manager.record_request_failure()
+        for _ in range(19):
+            self.manager._request_count += 1
+
+        with patch("src.runtime.adaptive_refresh.time.time", return_value=1e12), \
+                patch("src.runtime.adaptive_refresh.time.monotonic", return_value=1100.0):
+            self.manager.record_request_success()
+        self.assertEqual(self.manager._network_condition, NetworkCondition.POOR)
+
+        with patch("src.runtime.adaptive_refresh.time.monotonic", return_value=1400.0):
+            self.manager.record_request_success()
+        self.assertEqual(self.manager._network_condition, NetworkCondition.GOOD)
+
+
+if __name__ == '__main__':
+    unittest.main()
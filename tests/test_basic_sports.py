@@ -30,6 +30,9 @@ class TestBasicSportsModels(unittest.TestCase):
         self.assertEqual(league.sport_code, "basketball")
         self.assertEqual(league.team_count, 30)
         self.assertEqual(league.api.base_url, "http://test.com")
+        # Slotted: no per-instance __dict__
+        self.assertFalse(hasattr(league, "__dict__"))
+        self.assertFalse(hasattr(league.api, "__dict__"))
 
     def test_sport_config_creation(self):
         """Test creating a sport configuration."""
@@ -114,6 +117,140 @@ class TestBasicSportsModels(unittest.TestCase):
         if league.timing_overrides and "period_duration_minutes" in league.timing_overrides:
             self.assertEqual(league.timing_overrides["period_duration_minutes"], 10)
 
+    def test_effective_timing_applies_overrides(self):
+        """Test that league overrides produce a new timing config, reused across calls."""
+        from dataclasses import FrozenInstanceError
+        from src.sports.definitions import BASKETBALL_SPORT
+        from src.sports.leagues.wnba import WNBA_LEAGUE
+
+        effective = WNBA_LEAGUE.get_effective_timing(BASKETBALL_SPORT.timing)
+
+        self.assertEqual(effective.period_duration_minutes, 10)
+        self.assertEqual(BASKETBALL_SPORT.timing.period_duration_minutes, 12)
+        self.assertIs(WNBA_LEAGUE.get_effective_timing(BASKETBALL_SPORT.timing), effective)
+        with self.assertRaises(FrozenInstanceError):
+            effective.period_duration_minutes = 12
+
+    def test_period_name_template_follows_replace(self):
+        """Test that the precomputed period template is rebuilt for a replaced config."""
+        from dataclasses import replace
+        from src.sports.definitions import HOCKEY_SPORT
+
+        timing = replace(HOCKEY_SPORT.timing, period_name_format="{type}-{number}")
+
+        self.assertEqual(HOCKEY_SPORT.timing.format_period_name(2), "P2")
+        self.assertEqual(timing.format_period_name(2), "P-2")
+        self.assertEqual(timing, replace(timing))
+        self.assertNotIn("_regular_template", repr(timing))
+
+    def test_effective_scoring_override_is_reused(self):
+        """Test that an unhashable sport config is merged once and unknown keys are ignored."""
+        from src.sports.definitions import HOCKEY_SPORT
+
+        league = LeagueConfig(
+            name="Test League",
+            code="test",
+            sport_code="hockey",
+            api=LeagueAPIConfig(base_url="http://example.test", endpoints={}),
+            scoring_overrides={"default_score_value": 2, "get_score_value": None},
+        )
+
+        effective = league.get_effective_scoring(HOCKEY_SPORT.scoring)
+
+        self.assertEqual(effective.default_score_value, 2)
+        self.assertEqual(effective.get_score_value("unknown"), 2)
+        self.assertIs(league.get_effective_scoring(HOCKEY_SPORT.scoring), effective)
+
+    def test_sport_defaults_overtime_duration(self):
+        """Test that a missing overtime duration is filled in on a frozen config."""
+        timing = TimingConfig(
+            period_type="quarter",
+            regulation_periods=4,
+            period_duration_minutes=12,
+            clock_direction="down",
+            has_overtime=True,
+        )
+        sport = SportConfig(
+            name="Basketball",
+            code="basketball",
+            timing=timing,
+            scoring=ScoringConfig(scoring_types={}),
+            terminology=TerminologyConfig(
+                game_start_term="tipoff",
+                period_end_term="quarter",
+                game_end_term="final",
+                overtime_term="overtime"
+            )
+        )
+
+        self.assertEqual(sport.timing.overtime_duration_minutes, 5.0)
+
+    def test_sport_definition_mappings_are_read_only(self):
+        """Test that shared sport definitions cannot be mutated in place."""
+        from src.sports.definitions import HOCKEY_SPORT
+
+        self.assertEqual(HOCKEY_SPORT.scoring.get_score_value("goal"), 1)
+        with self.assertRaises(TypeError):
+            HOCKEY_SPORT.scoring.scoring_types["goal"] = 2
+        with self.assertRaises(TypeError):
+            HOCKEY_SPORT.extensions["has_power_play"] = False
+
+
+    def test_league_conference_structure_is_read_only(self):
+        """Test that built-in conference structures are immutable tuples."""
+        from src.sports.leagues.nhl import NHL_LEAGUE
+
+        self.assertEqual(NHL_LEAGUE.conference_structure["Eastern"], ("Metropolitan", "Atlantic"))
+        with self.assertRaises(TypeError):
+            NHL_LEAGUE.conference_structure["Eastern"] = ()
+
+
+class TestSportRegistry(unittest.TestCase):
+    """Test league registration in the sport registry."""
+
+    def setUp(self):
+        """Set up an empty registry with basketball registered."""
+        from src.sports.definitions import BASKETBALL_SPORT
+        from src.sports.registry import SportRegistry
+
+        self.registry = SportRegistry()
+        self.registry.register_sport(BASKETBALL_SPORT)
+
+    def test_lazy_league_resolves_on_lookup(self):
+        """Test that a league registered by path is imported on first lookup."""
+        from src.sports.leagues.wnba import WNBA_LEAGUE, WNBAClient
+
+        self.registry.register_league_lazy(
+            "wnba", "src.sports.leagues.wnba:WNBAClient", config_path="src.sports.leagues.wnba:WNBA_LEAGUE"
+        )
+
+        self.assertIs(self.registry.get_league_client_class("wnba"), WNBAClient)
+        self.assertIs(self.registry.get_league("wnba"), WNBA_LEAGUE)
+        self.assertEqual(self.registry.get_enabled_leagues(["wnba"]), [WNBA_LEAGUE])
+
+    def test_lazy_league_is_not_imported_at_registration(self):
+        """Test that registering by path does not import the module."""
+        self.registry.register_league_lazy(
+            "xyz", "src.sports.leagues.missing:XYZClient", config_path="src.sports.leagues.missing:XYZ_LEAGUE"
+        )
+
+        with self.assertRaises(ModuleNotFoundError):
+            self.registry.get_league("xyz")
+
+    def test_explicit_registration_replaces_pending_lazy_league(self):
+        """Test that a later explicit registration is not overwritten on first lookup."""
+        from dataclasses import replace
+        from src.sports.leagues.wnba import WNBA_LEAGUE, WNBAClient
+
+        self.registry.register_league_lazy(
+            "wnba", "src.sports.leagues.missing:XYZClient", config_path="src.sports.leagues.missing:XYZ_LEAGUE"
+        )
+        custom = replace(WNBA_LEAGUE, name="Custom WNBA")
+        self.registry.register_league(custom, WNBAClient)
+
+        self.assertIs(self.registry.get_league("wnba"), custom)
+        self.assertIs(self.registry.get_league_client_class("wnba"), WNBAClient)
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -12,6 +12,7 @@ from src.display.scenes.builtin import (
     IdleScene, PregameScene, LiveScene, LiveBigScene, FinalScene
 )
 from src.model.game import GameSnapshot, GameState, TeamInfo
+from src.render.scenes.nhl_large_logo import draw_nhl_large_logo
 from src.sports.models.sport_config import SportConfig
 from src.sports.models.league_config import LeagueConfig
 
@@ -200,6 +201,50 @@ class TestBuiltinScenes(unittest.TestCase):
         )
 
 
+class TestNHLLargeLogoScene(unittest.TestCase):
+    """Test the NHL large logo scoreboard."""
+
+    def _power_play_columns(self, state, power_play_team):
+        """Draw a game and return the x positions of power play marker pixels."""
+        buffer = Image.new("RGB", (64, 32))
+        snapshot = GameSnapshot(
+            sport=Mock(spec=SportConfig),
+            league=Mock(spec=LeagueConfig),
+            event_id="n1",
+            start_time_local=datetime.now(),
+            state=state,
+            home=TeamInfo(id="1", name="Home", abbr="BOS", score=2),
+            away=TeamInfo(id="2", name="Away", abbr="NYR", score=1),
+            current_period=2,
+            period_name="P2",
+            display_clock="12:00",
+            sport_specific_data={"power_play_team": power_play_team},
+        )
+
+        with patch("src.render.scenes.nhl_large_logo.logos.get_logo", return_value=None):
+            draw_nhl_large_logo(buffer, ImageDraw.Draw(buffer), snapshot, datetime.now())
+
+        return {
+            x for x in range(buffer.width) for y in range(buffer.height)
+            if buffer.getpixel((x, y)) == (255, 200, 0)
+        }
+
+    def test_power_play_marked_on_team_side(self):
+        """Test that "PP" is drawn on the side of the team with the man advantage."""
+        home = self._power_play_columns(GameState.LIVE, "home")
+        away = self._power_play_columns(GameState.LIVE, "away")
+
+        self.assertTrue(home)
+        self.assertTrue(away)
+        self.assertGreater(min(home), 32)
+        self.assertLess(max(away), 32)
+
+    def test_no_power_play_marker_at_even_strength_or_final(self):
+        """Test that nothing is marked without a power play or after the game."""
+        self.assertFalse(self._power_play_columns(GameState.LIVE, None))
+        self.assertFalse(self._power_play_columns(GameState.FINAL, "home"))
+
+
 class TestSceneManager(unittest.TestCase):
     """Test scene manager functionality."""
 
@@ -0,0 +1,351 @@
+"""Unit tests for multi-league game aggregation."""
+
+import threading
+import time
+import unittest
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import date, datetime, timedelta
+from unittest.mock import Mock, patch
+
+from src.model.game import GameSnapshot, GameState, TeamInfo
+from src.sports.clients.base import CachedLeagueClient
+from src.sports.definitions import BASKETBALL_SPORT, HOCKEY_SPORT
+from src.sports.league_aggregator import LeagueAggregator
+from src.sports.leagues.nhl import NHL_LEAGUE
+from src.sports.leagues.wnba import WNBA_LEAGUE
+
+
+def _make_game(event_id, league, sport, state=GameState.PRE, home_score=0, away_score=0,
+               home="HOM", away="AWY", start_time=None):
+    """Build a minimal game snapshot for aggregator tests."""
+    return GameSnapshot(
+        sport=sport,
+        league=league,
+        event_id=event_id,
+        start_time_local=start_time or datetime(2025, 6, 1, 19, 0),
+        state=state,
+        home=TeamInfo(id=home, name=f"{home} Team", abbr=home, score=home_score),
+        away=TeamInfo(id=away, name=f"{away} Team", abbr=away, score=away_score),
+        current_period=1 if state == GameState.LIVE else 0,
+        period_name="Q1" if state == GameState.LIVE else "",
+        display_clock="",
+    )
+
+
+class TestLeagueAggregator(unittest.TestCase):
+    """Test featured game selection across leagues."""
+
+    def setUp(self):
+        """Set up an aggregator with stubbed league clients."""
+        self.aggregator = LeagueAggregator(["wnba", "nhl"], enabled_leagues=[])
+        self.wnba_client = Mock(league=WNBA_LEAGUE)
+        self.nhl_client = Mock(league=NHL_LEAGUE)
+        self.aggregator.league_clients = {
+            "wnba": self.wnba_client,
+            "nhl": self.nhl_client,
+        }
+        self.target_date = date(2025, 6, 1)
+        self.now = datetime(2025, 6, 1, 18, 0)
+
+    def tearDown(self):
+        """Shut down the aggregator's fetch threads."""
+        self.aggregator.close()
+
+    def test_league_priority_wins_when_no_boosts_apply(self):
+        """Test that the higher priority league is featured."""
+        wnba_game = _make_game("w1", WNBA_LEAGUE, BASKETBALL_SPORT)
+        nhl_game = _make_game("n1", NHL_LEAGUE, HOCKEY_SPORT)
+        self.wnba_client.fetch_games.return_value = [wnba_game]
+        self.nhl_client.fetch_games.return_value = [nhl_game]
+
+        featured = self.aggregator.get_featured_game(self.target_date, self.now)
+
+        self.assertIs(featured, wnba_game)
+
+    def test_live_game_beats_league_priority(self):
+        """Test that a live game outranks a scheduled game in a higher league."""
+        wnba_game = _make_game("w1", WNBA_LEAGUE, BASKETBALL_SPORT)
+        nhl_game = _make_game("n1", NHL_LEAGUE, HOCKEY_SPORT, state=GameState.LIVE)
+        self.wnba_client.fetch_games.return_value = [wnba_game]
+        self.nhl_client.fetch_games.return_value = [nhl_game]
+
+        featured = self.aggregator.get_featured_game(self.target_date, self.now)
+
+        self.assertIs(featured, nhl_game)
+
+    def test_live_favorite_outranks_everything(self):
+        """Test that a live game with a favorite team wins over other live games."""
+        wnba_game = _make_game("w1", WNBA_LEAGUE, BASKETBALL_SPORT, state=GameState.LIVE,
+                               home_score=50, away_score=50)
+        nhl_game = _make_game("n1", NHL_LEAGUE, HOCKEY_SPORT, state=GameState.LIVE,
+                              home="BOS", away="NYR", home_score=5, away_score=0)
+        self.wnba_client.fetch_games.return_value = [wnba_game]
+        self.nhl_client.fetch_games.return_value = [nhl_game]
+
+        featured = self.aggregator.get_featured_game(self.target_date, self.now, {"nhl": ["BOS"]})
+
+        self.assertIs(featured, nhl_game)
+
+    def test_no_games_returns_none(self):
+        """Test that no games yields no featured game."""
+        self.wnba_client.fetch_games.return_value = []
+        self.nhl_client.fetch_games.return_value = []
+
+        self.assertIsNone(self.aggregator.get_featured_game(self.target_date, self.now))
+
+    def test_failing_league_is_skipped(self):
+        """Test that one league failing does not hide the others."""
+        nhl_game = _make_game("n1", NHL_LEAGUE, HOCKEY_SPORT)
+        self.wnba_client.fetch_games.side_effect = Exception("API Error")
+        self.nhl_client.fetch_games.return_value = [nhl_game]
+
+        featured = self.aggregator.get_featured_game(self.target_date, self.now)
+
+        self.assertIs(featured, nhl_game)
+
+    def test_leagues_are_fetched_concurrently(self):
+        """Test that league fetches overlap instead of running one after another."""
+        self.aggregator.close()
+        self.aggregator._pool = ThreadPoolExecutor(max_workers=2)
+        barrier = threading.Barrier(2, timeout=5)
+
+        def fetch(target_date):
+            barrier.wait()
+            return []
+
+        self.wnba_client.fetch_games.side_effect = fetch
+        self.nhl_client.fetch_games.side_effect = fetch
+
+        games = self.aggregator.get_all_games(self.target_date)
+
+        self.assertEqual(games, {"wnba": [], "nhl": []})
+
+    def test_get_all_games_keeps_failed_league_empty(self):
+        """Test that a failing league maps to an empty list."""
+        nhl_game = _make_game("n1", NHL_LEAGUE, HOCKEY_SPORT)
+        self.wnba_client.fetch_games.side_effect = Exception("API Error")
+        self.nhl_client.fetch_games.return_value = [nhl_game]
+
+        games = self.aggregator.get_all_games(self.target_date)
+
+        self.assertEqual(games, {"wnba": [], "nhl": [nhl_game]})
+
+    def test_priority_scores_not_written_into_games(self):
+        """Test that scores are kept beside the games, not written into them."""
+        wnba_game = _make_game("w1", WNBA_LEAGUE, BASKETBALL_SPORT)
+        nhl_game = _make_game("n1", NHL_LEAGUE, HOCKEY_SPORT, home="BOS", away="NYR")
+        self.wnba_client.fetch_games.return_value = [wnba_game]
+        self.nhl_client.fetch_games.return_value = [nhl_game]
+
+        self.aggregator.get_featured_game(self.target_date, self.now)
+
+        self.assertNotIn("priority_score", wnba_game.sport_specific_data)
+        self.assertNotIn("priority_score", nhl_game.sport_specific_data)
+
+    def test_live_first_picks_best_live_game(self):
+        """Test that live-first resolution picks the highest priority live game."""
+        self.aggregator.configure_priority_rules(live_game_boost=False, conflict_resolution="live_first")
+        wnba_game = _make_game("w1", WNBA_LEAGUE, BASKETBALL_SPORT)
+        blowout = _make_game("n1", NHL_LEAGUE, HOCKEY_SPORT, state=GameState.LIVE,
+                             home_score=7, away_score=0)
+        close = _make_game("n2", NHL_LEAGUE, HOCKEY_SPORT, state=GameState.LIVE,
+                           home_score=2, away_score=2)
+        self.wnba_client.fetch_games.return_value = [wnba_game]
+        self.nhl_client.fetch_games.return_value = [blowout, close]
+
+        featured = self.aggregator.get_featured_game(self.target_date, self.now)
+
+        self.assertIs(featured, close)
+
+    def test_manual_override_returns_selected_game(self):
+        """Test that a manual override bypasses priority calculation."""
+        wnba_game = _make_game("w1", WNBA_LEAGUE, BASKETBALL_SPORT)
+        nhl_game = _make_game("n1", NHL_LEAGUE, HOCKEY_SPORT)
+        self.wnba_client.fetch_games.return_value = [wnba_game]
+        self.nhl_client.fetch_games.return_value = [nhl_game]
+
+        self.aggregator.set_manual_override("n1")
+        featured = self.aggregator.get_featured_game(self.target_date, self.now)
+
+        self.assertIs(featured, nhl_game)
+
+        self.aggregator.clear_manual_override()
+        featured = self.aggregator.get_featured_game(self.target_date, self.now)
+
+        self.assertIs(featured, wnba_game)
+
+    def test_override_lookup_and_selection_share_one_fetch(self):
+        """Test that each league is fetched once per tick even with an override to search."""
+        wnba_game = _make_game("w1", WNBA_LEAGUE, BASKETBALL_SPORT)
+        self.wnba_client.fetch_games.return_value = [wnba_game]
+        self.nhl_client.fetch_games.return_value = []
+
+        self.aggregator.set_manual_override("missing")
+        featured = self.aggregator.get_featured_game(self.target_date, self.now)
+
+        self.assertIs(featured, wnba_game)
+        self.assertEqual(self.wnba_client.fetch_games.call_count, 1)
+        self.assertEqual(self.nhl_client.fetch_games.call_count, 1)
+
+    def test_fetch_cache_expires(self):
+        """Test that a league is fetched again once its cached result goes stale."""
+        self.wnba_client.fetch_games.return_value = []
+        self.nhl_client.fetch_games.return_value = []
+        self.aggregator.get_all_games(self.target_date)
+
+        self.aggregator._games_cache[("wnba", self.target_date)] = (float("-inf"), [])
+        self.aggregator.get_all_games(self.target_date)
+
+        self.assertEqual(self.wnba_client.fetch_games.call_count, 2)
+        self.assertEqual(self.nhl_client.fetch_games.call_count, 1)
+
+    def test_recently_stale_games_served_while_refreshing(self):
+        """Test that just-expired games are returned at once and refreshed in the background."""
+        old_game = _make_game("w1", WNBA_LEAGUE, BASKETBALL_SPORT)
+        new_game = _make_game("w1", WNBA_LEAGUE, BASKETBALL_SPORT, state=GameState.LIVE)
+        self.wnba_client.fetch_games.return_value = [new_game]
+        self.nhl_client.fetch_games.return_value = []
+        key = ("wnba", self.target_date)
+        self.aggregator._games_cache[key] = (time.monotonic() - 1, [old_game])
+
+        games = self.aggregator.get_all_games(self.target_date)
+        self.aggregator._pool.shutdown(wait=True)
+
+        self.assertEqual(games["wnba"], [old_game])
+        self.assertEqual(self.wnba_client.fetch_games.call_count, 1)
+        self.assertEqual(self.aggregator._games_cache[key][1], [new_game])
+        self.assertFalse(self.aggregator._inflight)
+
+    def test_concurrent_fetch_joins_one_in_flight(self):
+        """Test that a caller arriving mid-fetch waits for that fetch instead of starting another."""
+        game = _make_game("w1", WNBA_LEAGUE, BASKETBALL_SPORT)
+        in_flight = Future()
+        self.aggregator._inflight[("wnba", self.target_date)] = in_flight
+
+        follower = ThreadPoolExecutor(max_workers=1)
+        self.addCleanup(follower.shutdown)
+        result = follower.submit(
+            lambda: self.aggregator._games_future("wnba", self.wnba_client, self.target_date).result()
+        )
+        in_flight.set_result([game])
+
+        self.assertEqual(result.result(timeout=5), [game])
+        self.wnba_client.fetch_games.assert_not_called()
+
+    def test_in_flight_fetch_cleared_after_failure(self):
+        """Test that a failed fetch is not shared with later callers."""
+        self.wnba_client.fetch_games.side_effect = [Exception("API Error"), []]
+
+        with self.assertRaises(Exception):
+            self.aggregator._games_future("wnba", self.wnba_client, self.target_date).result()
+        self.assertEqual(self.aggregator._games_future("wnba", self.wnba_client, self.target_date).result(), [])
+        self.assertFalse(self.aggregator._inflight)
+
+    def test_stalled_league_serves_stale_games_without_more_workers(self):
+        """Test that a hung league is answered from its last games while one fetch stays in flight."""
+        self.aggregator.close()
+        self.aggregator._pool = ThreadPoolExecutor(max_workers=2)
+        self.aggregator._fetch_wait = 0.05
+        stale_game = _make_game("n1", NHL_LEAGUE, HOCKEY_SPORT)
+        self.aggregator._games_cache[("nhl", self.target_date)] = (time.monotonic() - 120, [stale_game])
+        release = threading.Event()
+        self.addCleanup(release.set)
+
+        def stalled_fetch(target_date):
+            release.wait(5)
+            return []
+
+        self.nhl_client.fetch_games.side_effect = stalled_fetch
+        self.wnba_client.fetch_games.return_value = []
+
+        first = self.aggregator.get_all_games(self.target_date)
+        second = self.aggregator.get_all_games(self.target_date)
+
+        self.assertEqual(first, {"wnba": [], "nhl": [stale_game]})
+        self.assertEqual(second, {"wnba": [], "nhl": [stale_game]})
+        self.assertEqual(self.nhl_client.fetch_games.call_count, 1)
+        self.assertEqual(list(self.aggregator._inflight), [("nhl", self.target_date)])
+
+        # Games too far past their expiry are not shown while the fetch hangs
+        self.aggregator._games_cache[("nhl", self.target_date)] = (time.monotonic() - 900, [stale_game])
+        with patch("src.sports.league_aggregator.http_timeout", return_value=0.05):
+            self.assertEqual(self.aggregator.get_all_games(self.target_date)["nhl"], [])
+
+    def test_cold_start_waits_for_slow_fetch(self):
+        """Test that a league with nothing cached is waited on past the short tick wait."""
+        self.aggregator._fetch_wait = 0.01
+        game = _make_game("w1", WNBA_LEAGUE, BASKETBALL_SPORT)
+
+        def slow_fetch(target_date):
+            time.sleep(0.2)
+            return [game]
+
+        self.wnba_client.fetch_games.side_effect = slow_fetch
+        self.nhl_client.fetch_games.return_value = []
+
+        games = self.aggregator.get_all_games(self.target_date)
+
+        self.assertEqual(games["wnba"], [game])
+
+    def test_new_date_only_drops_that_leagues_old_dates(self):
+        """Test that storing one league's games for a date keeps other leagues' entries."""
+        other_league = ("nhl", self.target_date - timedelta(days=1))
+        self.aggregator._games_cache[other_league] = (time.monotonic() + 60, [])
+        self.aggregator._games_cache[("wnba", self.target_date - timedelta(days=1))] = (time.monotonic() + 60, [])
+        self.wnba_client.fetch_games.return_value = []
+
+        self.aggregator._fetch_and_store("wnba", self.wnba_client, self.target_date)
+
+        self.assertEqual(set(self.aggregator._games_cache), {other_league, ("wnba", self.target_date)})
+
+    def test_self_caching_client_asked_every_tick(self):
+        """Test that a client with its own cache is not stacked under the aggregator's TTL."""
+        cached_client = Mock(spec=CachedLeagueClient, league=WNBA_LEAGUE)
+        cached_client.fetch_games.return_value = []
+        self.aggregator.league_clients = {"wnba": cached_client}
+
+        self.aggregator.get_all_games(self.target_date)
+        self.aggregator.get_all_games(self.target_date)
+
+        self.assertEqual(cached_client.fetch_games.call_count, 2)
+
+    def test_manual_override_expires(self):
+        """Test that an expired override no longer applies."""
+        wnba_game = _make_game("w1", WNBA_LEAGUE, BASKETBALL_SPORT)
+        nhl_game = _make_game("n1", NHL_LEAGUE, HOCKEY_SPORT)
+        self.wnba_client.fetch_games.return_value = [wnba_game]
+        self.nhl_client.fetch_games.return_value = [nhl_game]
+
+        self.aggregator.set_manual_override("n1", duration_hours=0)
+        featured = self.aggregator.get_featured_game(self.target_date, self.now)
+
+        self.assertIs(featured, wnba_game)
+
+    def test_single_league_single_game_skips_scoring(self):
+        """Test that a lone game in a lone league is returned without priority scoring."""
+        wnba_game = _make_game("w1", WNBA_LEAGUE, BASKETBALL_SPORT)
+        self.aggregator.league_clients = {"wnba": self.wnba_client}
+        self.wnba_client.fetch_games.return_value = [wnba_game]
+
+        with patch.object(self.aggregator, "_calculate_game_priority") as calculate:
+            featured = self.aggregator.get_featured_game(self.target_date, self.now)
+
+        self.assertIs(featured, wnba_game)
+        calculate.assert_not_called()
+
+    def test_pregame_proximity_boost(self):
+        """Test that an imminent game outranks a later one in the same league."""
+        later = _make_game("w1", WNBA_LEAGUE, BASKETBALL_SPORT,
+                           start_time=self.now + timedelta(hours=5))
+        sooner = _make_game("w2", WNBA_LEAGUE, BASKETBALL_SPORT,
+                            start_time=self.now + timedelta(minutes=30))
+        self.wnba_client.fetch_games.return_value = [later, sooner]
+        self.nhl_client.fetch_games.return_value = []
+
+        featured = self.aggregator.get_featured_game(self.target_date, self.now)
+
+        self.assertIs(featured, sooner)
+
+
+if __name__ == '__main__':
+    unittest.main()
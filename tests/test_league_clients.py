@@ -0,0 +1,896 @@
+"""Unit tests for league API client base classes."""
+
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+from datetime import date, datetime, timezone
+from unittest.mock import Mock, patch
+
+import requests
+
+from src.model.game import GameSnapshot, GameState, TeamInfo
+from src.sports.clients.base import CachedLeagueClient, games_ttl
+from src.sports.definitions import BASKETBALL_SPORT, HOCKEY_SPORT
+from src.sports.leagues.nba import NBA_LEAGUE, NBAClient
+from src.sports.leagues.nhl import NHL_LEAGUE, NHLClient, _parse_start
+from src.sports.leagues.wnba import WNBA_LEAGUE, WNBAClient
+
+
+class _StubCachedClient(CachedLeagueClient):
+    """Concrete cached client that never touches the network."""
+
+    def fetch_games(self, target_date):
+        return []
+
+    def fetch_teams(self):
+        return []
+
+
+class TestCachedLeagueClient(unittest.TestCase):
+    """Test the on-disk game cache."""
+
+    def setUp(self):
+        """Set up a client backed by a temporary cache directory."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.client = _StubCachedClient(WNBA_LEAGUE, BASKETBALL_SPORT, cache_dir=self.temp_dir)
+        self.cache_key = self.client._get_cache_key(date(2025, 6, 1))
+
+    def tearDown(self):
+        """Clean up the temporary cache directory."""
+        shutil.rmtree(self.temp_dir)
+
+    def _make_game(self, event_id="401", state=GameState.LIVE):
+        return GameSnapshot(
+            sport=BASKETBALL_SPORT,
+            league=WNBA_LEAGUE,
+            event_id=event_id,
+            start_time_local=datetime(2025, 6, 1, 19, 30),
+            state=state,
+            home=TeamInfo(id="1", name="Las Vegas Aces", abbr="LV", score=55,
+                          colors={"primary": "000000"}),
+            away=TeamInfo(id="2", name="Seattle Storm", abbr="SEA", score=51),
+            current_period=3,
+            period_name="Q3",
+            display_clock="4:12",
+            status_detail="3rd Quarter",
+            sport_specific_data={"is_overtime": False},
+        )
+
+    def test_only_recent_dates_kept(self):
+        """Test that saving a new date forgets the oldest one in memory and on disk."""
+        keys = [self.client._get_cache_key(date(2025, 6, day)) for day in range(1, 5)]
+        for key in keys:
+            self.client._save_to_cache(key, [self._make_game()], etag=key)
+
+        self.assertEqual(list(self.client._mem_cache), keys[1:])
+        self.assertEqual(list(self.client._validators), keys[1:])
+        saved = sorted(path.name for path in self.client.cache_path.iterdir())
+        self.assertEqual(saved, [f"{key}.mpk" for key in keys[1:]])
+
+    def test_round_trip(self):
+        """Test that saved games load back with the same content."""
+        game = self._make_game()
+        self.client._save_to_cache(self.cache_key, [game])
+
+        loaded = self.client._load_from_cache(self.cache_key)
+
+        self.assertEqual(len(loaded), 1)
+        restored = loaded[0]
+        self.assertEqual(restored.event_id, game.event_id)
+        self.assertEqual(restored.start_time_local, game.start_time_local)
+        self.assertEqual(restored.state, GameState.LIVE)
+        self.assertEqual(restored.home, game.home)
+        self.assertEqual(restored.away, game.away)
+        self.assertEqual(restored.period_name, "Q3")
+        self.assertEqual(restored.sport_specific_data, {"is_overtime": False})
+        self.assertIs(restored.sport, BASKETBALL_SPORT)
+        self.assertIs(restored.league, WNBA_LEAGUE)
+
+    def test_repeat_load_served_from_memory(self):
+        """Test that a second load within the TTL skips the file entirely."""
+        self.client._save_to_cache(self.cache_key, [self._make_game()])
+        fresh_client = _StubCachedClient(WNBA_LEAGUE, BASKETBALL_SPORT, cache_dir=self.temp_dir)
+        first = fresh_client._load_from_cache(self.cache_key)
+
+        (fresh_client.cache_path / f"{self.cache_key}.mpk").unlink()
+        second = fresh_client._load_from_cache(self.cache_key)
+
+        self.assertIs(second, first)
+
+    def test_unchanged_teams_are_interned_across_dates(self):
+        """Test that identical decoded teams share one instance."""
+        other_key = self.client._get_cache_key(date(2025, 6, 2))
+        self.client._save_to_cache(self.cache_key, [self._make_game()])
+        self.client._save_to_cache(other_key, [self._make_game(event_id="402")])
+        fresh_client = _StubCachedClient(WNBA_LEAGUE, BASKETBALL_SPORT, cache_dir=self.temp_dir)
+
+        first = fresh_client._load_from_cache(self.cache_key)[0]
+        second = fresh_client._load_from_cache(other_key)[0]
+
+        self.assertIs(first.home, second.home)
+        self.assertIs(first.away, second.away)
+
+    def test_missing_cache_returns_none(self):
+        """Test that a date with no cache file is a miss."""
+        self.assertIsNone(self.client._load_from_cache(self.cache_key))
+
+    def test_corrupt_cache_returns_none(self):
+        """Test that an unreadable cache file is treated as a miss."""
+        (self.client.cache_path / f"{self.cache_key}.mpk").write_bytes(b"not a cache")
+
+        self.assertIsNone(self.client._load_from_cache(self.cache_key))
+
+    def test_legacy_json_cache_is_readable(self):
+        """Test that JSON caches written before the msgpack switch still load."""
+        legacy = (
+            '[{"event_id": "401", "start_time_local": "2025-06-01T19:30:00", "state": "FINAL",'
+            ' "home": {"id": "1", "name": "Las Vegas Aces", "abbr": "LV", "score": 80},'
+            ' "away": {"id": "2", "name": "Seattle Storm", "abbr": "SEA", "score": 77},'
+            ' "current_period": 4, "period_name": "Q4", "display_clock": "0:00"}]'
+        )
+        (self.client.cache_path / f"{self.cache_key}.json").write_text(legacy)
+
+        loaded = self.client._load_from_cache(self.cache_key)
+
+        self.assertEqual(len(loaded), 1)
+        self.assertEqual(loaded[0].state, GameState.FINAL)
+        self.assertEqual(loaded[0].home.score, 80)
+
+    def test_legacy_numeric_state_is_readable(self):
+        """Test that caches storing the enum value still decode the state."""
+        legacy = (
+            '[{"event_id": "401", "start_time_local": "2025-06-01T19:30:00", "state": %d,'
+            ' "home": {"id": "1", "name": "Las Vegas Aces", "abbr": "LV"},'
+            ' "away": {"id": "2", "name": "Seattle Storm", "abbr": "SEA"},'
+            ' "current_period": 2, "period_name": "Q2", "display_clock": "1:00"}]'
+        ) % GameState.LIVE.value
+        (self.client.cache_path / f"{self.cache_key}.json").write_text(legacy)
+
+        loaded = self.client._load_from_cache(self.cache_key)
+
+        self.assertEqual(loaded[0].state, GameState.LIVE)
+
+    def test_cache_for_other_league_is_ignored(self):
+        """Test that a cache file written by another league's client is a miss."""
+        self.client._save_to_cache(self.cache_key, [self._make_game()])
+        other = _StubCachedClient(WNBA_LEAGUE, HOCKEY_SPORT, cache_dir=self.temp_dir)
+
+        self.assertIsNone(other._load_from_cache(self.cache_key))
+
+    def test_cache_written_as_msgpack(self):
+        """Test that saves go to the binary cache file."""
+        self.client._save_to_cache(self.cache_key, [self._make_game()])
+
+        self.assertTrue((self.client.cache_path / f"{self.cache_key}.mpk").exists())
+        self.assertFalse((self.client.cache_path / f"{self.cache_key}.json").exists())
+        self.assertEqual(list(self.client.cache_path.glob("*.tmp")), [])
+
+    def test_memo_ttl_follows_game_state(self):
+        """Test that finished games stay memoized longer than the league TTL and live ones less."""
+        final_key = self.client._get_cache_key(date(2025, 5, 31))
+        self.client._save_to_cache(final_key, [self._make_game(state=GameState.FINAL)])
+        self.client._save_to_cache(self.cache_key, [
+            self._make_game(state=GameState.FINAL),
+            self._make_game(event_id="402", state=GameState.LIVE),
+        ])
+        now = time.monotonic()
+        ttl = WNBA_LEAGUE.api.cache_ttl_seconds
+
+        self.assertGreater(self.client._mem_cache[final_key][0] - now, ttl)
+        self.assertLessEqual(self.client._mem_cache[self.cache_key][0] - now, 10)
+
+    def test_ttl_follows_what_is_happening_in_the_game(self):
+        """Test that intermissions wait longer and imminent starts refresh sooner."""
+        live = self._make_game()
+        intermission = self._make_game()
+        intermission.sport_specific_data = {"intermission_seconds": 120}
+        long_break = self._make_game()
+        long_break.sport_specific_data = {"intermission_seconds": 1000}
+        soon = self._make_game(state=GameState.PRE)
+        soon.seconds_to_start = 600
+        later = self._make_game(state=GameState.PRE)
+        later.seconds_to_start = 7200
+
+        self.assertEqual(games_ttl([live], 300), 10)
+        self.assertEqual(games_ttl([intermission], 300), 120)
+        self.assertEqual(games_ttl([long_break], 300), 300)
+        self.assertEqual(games_ttl([soon], 300), 60)
+        self.assertEqual(games_ttl([later], 300), 300)
+        self.assertEqual(games_ttl([intermission, soon], 300), 60)
+        self.assertEqual(games_ttl([], 300), 300)
+
+    def test_stale_live_file_is_a_miss(self):
+        """Test that a live game's file older than its state TTL is refetched."""
+        self.client._save_to_cache(self.cache_key, [self._make_game(state=GameState.LIVE)])
+        cache_file = self.client.cache_path / f"{self.cache_key}.mpk"
+        stale = time.time() - 60
+        os.utime(cache_file, (stale, stale))
+        fresh_client = _StubCachedClient(WNBA_LEAGUE, BASKETBALL_SPORT, cache_dir=self.temp_dir)
+
+        self.assertIsNone(fresh_client._load_from_cache(self.cache_key))
+
+    def test_disk_ttl_follows_game_state(self):
+        """Test that a finished game's file outlives the league TTL, like its memoized entry."""
+        self.client._save_to_cache(self.cache_key, [self._make_game(state=GameState.FINAL)])
+        cache_file = self.client.cache_path / f"{self.cache_key}.mpk"
+        older = time.time() - 2 * WNBA_LEAGUE.api.cache_ttl_seconds
+        os.utime(cache_file, (older, older))
+        fresh_client = _StubCachedClient(WNBA_LEAGUE, BASKETBALL_SPORT, cache_dir=self.temp_dir)
+
+        self.assertEqual(len(fresh_client._load_from_cache(self.cache_key)), 1)
+
+    def test_stale_file_revalidated_after_restart(self):
+        """Test that an expired file's validators are sent and its games reused on 304."""
+        self.client._save_to_cache(self.cache_key, [self._make_game()], '"abc"')
+        os.utime(self.client.cache_path / f"{self.cache_key}.mpk", (0, 0))
+        fresh_client = _StubCachedClient(WNBA_LEAGUE, BASKETBALL_SPORT, cache_dir=self.temp_dir)
+        fresh_client._session = Mock()
+        mock_get = fresh_client._session.get
+        mock_get.return_value = Mock(status_code=304, content=b"", headers={})
+        parse_body = Mock()
+
+        games = fresh_client._fetch_games_cached(date(2025, 6, 1), "http://example.test", parse_body)
+
+        self.assertEqual([game.event_id for game in games], ["401"])
+        parse_body.assert_not_called()
+        self.assertEqual(mock_get.call_args.kwargs["headers"]["If-None-Match"], '"abc"')
+
+    def test_validators_persist_in_envelope(self):
+        """Test that ETag and Last-Modified survive a reload from disk."""
+        self.client._save_to_cache(self.cache_key, [self._make_game()], '"abc"', "Sun, 01 Jun 2025 19:00:00 GMT")
+        fresh_client = _StubCachedClient(WNBA_LEAGUE, BASKETBALL_SPORT, cache_dir=self.temp_dir)
+
+        fresh_client._load_from_cache(self.cache_key)
+
+        self.assertEqual(fresh_client._validators[self.cache_key], ('"abc"', "Sun, 01 Jun 2025 19:00:00 GMT"))
+
+    def test_not_modified_reuses_parsed_games(self):
+        """Test that a 304 after the TTL returns the memoized games without parsing."""
+        self.client._session = Mock()
+        mock_get = self.client._session.get
+        game = self._make_game()
+        self.client._save_to_cache(self.cache_key, [game], '"abc"')
+        # Push the memoized entry and the file past the TTL
+        self.client._mem_cache[self.cache_key] = (0.0, [game])
+        os.utime(self.client.cache_path / f"{self.cache_key}.mpk", (0, 0))
+        mock_get.return_value = Mock(status_code=304, content=b"", headers={})
+        parse_body = Mock()
+
+        games = self.client._fetch_games_cached(date(2025, 6, 1), "http://example.test", parse_body)
+
+        self.assertIs(games[0], game)
+        parse_body.assert_not_called()
+        self.assertEqual(mock_get.call_args.kwargs["headers"]["If-None-Match"], '"abc"')
+        # The TTL window restarts, so the next call stays off the network
+        self.client._fetch_games_cached(date(2025, 6, 1), "http://example.test", parse_body)
+        self.assertEqual(mock_get.call_count, 1)
+
+    def test_first_fetch_is_unconditional(self):
+        """Test that a cold cache fetches, parses and stores the response validators."""
+        self.client._session = Mock()
+        mock_get = self.client._session.get
+        mock_get.return_value = Mock(status_code=200, content=b"body", headers={"ETag": '"v1"'})
+        parse_body = Mock(return_value=[self._make_game()])
+
+        self.client._fetch_games_cached(date(2025, 6, 1), "http://example.test", parse_body)
+
+        parse_body.assert_called_once_with(b"body")
+        self.assertNotIn("If-None-Match", mock_get.call_args.kwargs["headers"])
+        self.assertEqual(self.client._validators[self.cache_key], ('"v1"', None))
+
+
+class TestClientModuleLayout(unittest.TestCase):
+    """Guard against the cache path being shadowed or split again."""
+
+    def test_cache_methods_defined_on_cached_client(self):
+        """Test that the canonical cache implementation lives on CachedLeagueClient."""
+        self.assertIn("_load_from_cache", CachedLeagueClient.__dict__)
+        self.assertIn("_save_to_cache", CachedLeagueClient.__dict__)
+
+    def test_adapter_uses_unified_snapshot(self):
+        """Test that the legacy adapter imports against the single snapshot model."""
+        from src.sports import adapter
+
+        self.assertIs(adapter.GameSnapshot, GameSnapshot)
+
+    def test_league_package_exports_resolve_lazily(self):
+        """Test that package-level league exports resolve to the submodule objects."""
+        from src.sports import leagues
+        from src.sports.leagues import wnba
+
+        self.assertIs(leagues.WNBA_LEAGUE, wnba.WNBA_LEAGUE)
+        self.assertIs(leagues.WNBAClient, wnba.WNBAClient)
+        with self.assertRaises(AttributeError):
+            leagues.MLB_LEAGUE
+
+
+class TestLeagueClientStateParsing(unittest.TestCase):
+    """Test API state string parsing."""
+
+    def setUp(self):
+        """Set up a client for parsing helpers."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.client = _StubCachedClient(WNBA_LEAGUE, BASKETBALL_SPORT, cache_dir=self.temp_dir)
+
+    def tearDown(self):
+        """Clean up the temporary cache directory."""
+        shutil.rmtree(self.temp_dir)
+
+    def test_parse_game_state(self):
+        """Test mapping of API state strings."""
+        self.assertEqual(self.client.parse_game_state("pre"), GameState.PRE)
+        self.assertEqual(self.client.parse_game_state("Scheduled"), GameState.PRE)
+        self.assertEqual(self.client.parse_game_state("post"), GameState.FINAL)
+        self.assertEqual(self.client.parse_game_state("FINAL"), GameState.FINAL)
+        self.assertEqual(self.client.parse_game_state("in"), GameState.LIVE)
+
+    def test_format_period_name(self):
+        """Test period names come from the effective timing config."""
+        self.assertEqual(self.client.format_period_name(2), "Q2")
+        self.assertEqual(self.client.format_period_name(5, is_overtime=True), "OT")
+        self.assertEqual(self.client.format_period_name(6, is_overtime=True), "OT2")
+
+
+
+def _nhl_game(game_id, state="LIVE", home_score=2, away_score=1):
+    """Build a minimal NHL score API game record."""
+    return {
+        "id": game_id,
+        "gameState": state,
+        "startTimeUTC": "2025-01-10T00:00:00Z",
+        "homeTeam": {"id": 6, "name": {"default": "Bruins"}, "abbrev": "BOS", "score": home_score},
+        "awayTeam": {"id": 3, "name": {"default": "Rangers"}, "abbrev": "NYR", "score": away_score},
+        "periodDescriptor": {"number": 2, "periodType": "REG"},
+        "clock": {"timeRemaining": "12:34"},
+    }
+
+
+class TestNHLClient(unittest.TestCase):
+    """Test NHL score API parsing."""
+
+    def setUp(self):
+        """Set up a client with a stubbed HTTP session and a temporary cache directory."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.client = NHLClient(NHL_LEAGUE, HOCKEY_SPORT, cache_dir=self.temp_dir.name)
+        self.client._session = Mock()
+        self.response = self.client._session.get.return_value
+
+    def _respond(self, payload):
+        self.response.content = json.dumps(payload).encode()
+
+    def test_fetch_games_parses_scoreboard(self):
+        """Test that games are fetched through the shared session and parsed."""
+        self._respond({"games": [_nhl_game(2024020001)]})
+
+        games = self.client.fetch_games(date(2025, 1, 9))
+
+        self.client._session.get.assert_called_once()
+        self.assertEqual(len(games), 1)
+        game = games[0]
+        self.assertEqual(game.event_id, "2024020001")
+        self.assertEqual(game.state, GameState.LIVE)
+        self.assertEqual((game.away.abbr, game.home.abbr), ("NYR", "BOS"))
+        self.assertEqual(game.home.score, 2)
+        self.assertEqual(game.period_name, "P2")
+        self.assertEqual(game.display_clock, "12:34")
+        self.assertEqual(game.start_time_local, datetime(2025, 1, 10, tzinfo=timezone.utc))
+        self.assertEqual(game.sport_specific_data["intermission_seconds"], 0)
+
+    def test_intermission_time_is_recorded(self):
+        """Test that the remaining intermission time is kept for cache timing."""
+        game = _nhl_game(1)
+        game["clock"] = {"timeRemaining": "20:00", "secondsRemaining": 845, "inIntermission": True}
+        self._respond({"games": [game]})
+
+        games = self.client.fetch_games(date(2025, 1, 9))
+
+        self.assertEqual(games[0].sport_specific_data["intermission_seconds"], 845)
+
+    def test_start_times_parsed_once_per_string(self):
+        """Test that a start time repeated across polls is parsed once and stays UTC-aware."""
+        _parse_start.cache_clear()
+        self._respond({"games": [_nhl_game(1), _nhl_game(2, state="FINAL")]})
+
+        games = self.client.fetch_games(date(2025, 1, 9))
+        self.client.fetch_games(date(2025, 1, 10))
+
+        self.assertEqual(games[0].start_time_local, datetime(2025, 1, 10, tzinfo=timezone.utc))
+        info = _parse_start.cache_info()
+        self.assertEqual((info.misses, info.currsize), (1, 1))
+
+    def test_fetch_games_batch_fetches_dates_concurrently(self):
+        """Test that several dates are fetched side by side and keyed by date."""
+        dates = [date(2025, 1, 8), date(2025, 1, 9), date(2025, 1, 10)]
+        barrier = threading.Barrier(len(dates), timeout=5)
+
+        def fetch(target_date):
+            barrier.wait()
+            return [target_date.day]
+
+        with patch.object(self.client, "fetch_games", side_effect=fetch):
+            games = self.client.fetch_games_batch(dates)
+
+        self.assertEqual(games, {dates[0]: [8], dates[1]: [9], dates[2]: [10]})
+
+    def test_missing_or_null_sub_objects_use_defaults(self):
+        """Test that absent or null nested objects parse to the defaults."""
+        game = _nhl_game(1)
+        game["clock"] = None
+        game["homeTeam"]["name"] = None
+        del game["periodDescriptor"]
+        self._respond({"games": [game]})
+
+        parsed = self.client.fetch_games(date(2025, 1, 9))[0]
+
+        self.assertEqual(parsed.home.name, "")
+        self.assertEqual(parsed.display_clock, "00:00")
+        self.assertEqual(parsed.current_period, 0)
+
+    def test_power_play_read_from_situation_code(self):
+        """Test that the side with more players on the ice is recorded as on the power play."""
+        codes = {"1451": "home", "1541": "away", "1551": None, "0651": None, "0641": "away", "": None}
+        games = []
+        for index, code in enumerate(codes, 1):
+            game = _nhl_game(index)
+            game["situation"] = {"situationCode": code}
+            games.append(game)
+        games.append(_nhl_game(len(codes) + 1))
+        self._respond({"games": games})
+
+        parsed = self.client.fetch_games(date(2025, 1, 9))
+
+        self.assertEqual(
+            [game.sport_specific_data["power_play_team"] for game in parsed],
+            [*codes.values(), None],
+        )
+
+    def test_previous_day_games_are_included_once(self):
+        """Test that previous-day games are added and games listed twice are parsed once."""
+        self._respond({
+            "games": [_nhl_game(1)],
+            "prevDate": "2025-01-08",
+            "gamesByDate": [
+                {"date": "2025-01-07", "games": [_nhl_game(7)]},
+                {"date": "2025-01-08", "games": [_nhl_game(1), _nhl_game(2)]},
+            ],
+        })
+
+        games = self.client.fetch_games(date(2025, 1, 9))
+
+        self.assertEqual([game.event_id for game in games], ["1", "2"])
+
+    def test_iter_games_parses_lazily(self):
+        """Test that stopping at the first live game leaves the rest unparsed."""
+        data = {"games": [_nhl_game(1, state="FUT"), _nhl_game(2), _nhl_game(3)]}
+
+        with patch.object(self.client, "_parse_game", wraps=self.client._parse_game) as parse_game:
+            live = next(game for game in self.client._iter_games(data, date(2025, 1, 9))
+                        if game.state == GameState.LIVE)
+
+        self.assertEqual(live.event_id, "2")
+        self.assertEqual(parse_game.call_count, 2)
+
+    def test_unchanged_response_parsed_once(self):
+        """Test that a re-served body reuses the games parsed from it."""
+        self._respond({"games": [_nhl_game(1), _nhl_game(2, state="FINAL")]})
+
+        with patch.object(self.client, "_parse_game", wraps=self.client._parse_game) as parse_game:
+            first = self.client.fetch_games(date(2025, 1, 9))
+            second = self.client.fetch_games(date(2025, 1, 9))
+
+        self.assertEqual(parse_game.call_count, 2)
+        self.assertEqual(second, first)
+        self.assertIsNot(second, first)
+
+    def test_changed_response_or_pregame_slate_reparsed(self):
+        """Test that new bodies and slates with countdowns are parsed again."""
+        with patch.object(self.client, "_parse_game", wraps=self.client._parse_game) as parse_game:
+            self._respond({"games": [_nhl_game(1, home_score=2)]})
+            self.client.fetch_games(date(2025, 1, 9))
+            self._respond({"games": [_nhl_game(1, home_score=3)]})
+            self.client.fetch_games(date(2025, 1, 9))
+            self._respond({"games": [_nhl_game(1, state="FUT")]})
+            self.client.fetch_games(date(2025, 1, 9))
+            self.client.fetch_games(date(2025, 1, 9))
+
+        self.assertEqual(parse_game.call_count, 4)
+
+    def test_parse_cache_is_bounded(self):
+        """Test that the oldest parsed bodies are evicted."""
+        for score in range(12):
+            self._respond({"games": [_nhl_game(1, home_score=score)]})
+            self.client.fetch_games(date(2025, 1, 9))
+
+        self.assertEqual(len(self.client._parse_cache), 8)
+
+    def test_game_states_map_from_score_api(self):
+        """Test that scheduled and finished NHL states are not treated as live."""
+        states = ["FUT", "PRE", "LIVE", "CRIT", "FINAL", "OFF"]
+        self._respond({"games": [_nhl_game(index, state=state) for index, state in enumerate(states, 1)]})
+
+        games = self.client.fetch_games(date(2025, 1, 9))
+
+        self.assertEqual([game.state for game in games], [
+            GameState.PRE, GameState.PRE, GameState.LIVE, GameState.LIVE, GameState.FINAL, GameState.FINAL,
+        ])
+
+    def test_pregame_countdown_uses_fetch_time(self):
+        """Test that seconds to start are measured from one clock read per fetch."""
+        self._respond({"games": [_nhl_game(1, state="FUT"), _nhl_game(2, state="PRE")]})
+        now = datetime(2025, 1, 9, 23, 0, tzinfo=timezone.utc)
+
+        with patch("src.sports.leagues.nhl.datetime", wraps=datetime) as mock_datetime:
+            mock_datetime.now.return_value = now
+            games = self.client.fetch_games(date(2025, 1, 9))
+
+        self.assertEqual([game.seconds_to_start for game in games], [3600, 3600])
+        mock_datetime.now.assert_called_once_with(timezone.utc)
+
+    def test_fetch_games_failure_returns_empty(self):
+        """Test that HTTP errors yield no games rather than raising."""
+        self.response.raise_for_status.side_effect = Exception("503")
+
+        self.assertEqual(self.client.fetch_games(date(2025, 1, 9)), [])
+
+    def test_fetch_failure_logged(self):
+        """Test that a failed request is logged and yields no games."""
+        self.client._session.get.side_effect = requests.ConnectionError("down")
+
+        with self.assertLogs("src.sports.leagues.nhl", level="ERROR") as logs:
+            self.assertEqual(self.client.fetch_games(date(2025, 1, 9)), [])
+        self.assertIn("down", logs.output[0])
+
+    def test_last_response_served_after_restart_during_outage(self):
+        """Test that a new client falls back to the last saved response for the date."""
+        self._respond({"games": [_nhl_game(1, state="FINAL")]})
+        self.client.fetch_games(date(2025, 1, 9))
+
+        restarted = NHLClient(NHL_LEAGUE, HOCKEY_SPORT, cache_dir=self.temp_dir.name)
+        restarted._session = Mock()
+        restarted._session.get.side_effect = requests.ConnectionError("down")
+
+        with self.assertLogs("src.sports.leagues.nhl", level="INFO"):
+            games = restarted.fetch_games(date(2025, 1, 9))
+        self.assertEqual([game.event_id for game in games], ["1"])
+        self.assertEqual(restarted.fetch_games(date(2025, 1, 10)), [])
+
+    def test_only_recent_dates_responses_kept(self):
+        """Test that saving responses for several dates keeps the three most recent."""
+        self._respond({"games": [_nhl_game(1)]})
+        for day in range(8, 12):
+            self.client.fetch_games(date(2025, 1, day))
+
+        saved = sorted(path.name for path in self.client._fallback_dir.iterdir())
+        self.assertEqual(saved, ["score_2025-01-09.json", "score_2025-01-10.json", "score_2025-01-11.json"])
+
+    def test_old_saved_response_not_served(self):
+        """Test that a response saved long before an outage is not shown as current."""
+        self._respond({"games": [_nhl_game(1)]})
+        self.client.fetch_games(date(2025, 1, 9))
+        fallback_file = self.client._fallback_dir / "score_2025-01-09.json"
+        an_hour_ago = time.time() - 3600
+        os.utime(fallback_file, (an_hour_ago, an_hour_ago))
+        self.client._session.get.side_effect = requests.ConnectionError("down")
+
+        with self.assertLogs("src.sports.leagues.nhl", level="INFO") as logs:
+            self.assertEqual(self.client.fetch_games(date(2025, 1, 9)), [])
+        self.assertIn("too old", logs.output[-1])
+
+    def test_live_score_changes_saved_at_most_once_a_minute(self):
+        """Test that score-only changes are throttled while state changes are saved at once."""
+        fallback_file = self.client._fallback_dir / "score_2025-01-09.json"
+
+        def poll(at, **game):
+            self._respond({"games": [_nhl_game(1, **game)]})
+            with patch("src.sports.leagues.nhl.time.monotonic", return_value=at):
+                self.client.fetch_games(date(2025, 1, 9))
+            return json.loads(fallback_file.read_bytes())["games"][0]
+
+        self.assertEqual(poll(1000.0, home_score=2)["homeTeam"]["score"], 2)
+        self.assertEqual(poll(1010.0, home_score=3)["homeTeam"]["score"], 2)
+        self.assertEqual(poll(1061.0, home_score=3)["homeTeam"]["score"], 3)
+        self.assertEqual(poll(1062.0, state="FINAL", home_score=4)["gameState"], "FINAL")
+
+
+def _espn_event(event_id, state_name="STATUS_IN_PROGRESS", period=2, date_str="2025-01-10T00:30Z"):
+    """Build a minimal ESPN scoreboard event."""
+    return {
+        "id": event_id,
+        "date": date_str,
+        "status": {
+            "period": period,
+            "displayClock": "5:00",
+            "type": {"name": state_name, "detail": "2nd Quarter"},
+        },
+        "competitions": [{
+            "competitors": [
+                {"homeAway": "home", "score": "50",
+                 "team": {"id": "13", "displayName": "Los Angeles Lakers", "abbreviation": "LAL"}},
+                {"homeAway": "away", "score": "48",
+                 "team": {"id": "2", "displayName": "Boston Celtics", "abbreviation": "BOS"}},
+            ],
+        }],
+    }
+
+
+class TestNBAClient(unittest.TestCase):
+    """Test ESPN NBA scoreboard parsing."""
+
+    def setUp(self):
+        """Set up a client with a stubbed HTTP session."""
+        self.client = NBAClient(NBA_LEAGUE, BASKETBALL_SPORT)
+        self.client._session = Mock()
+        self.response = self.client._session.get.return_value
+
+    def _respond(self, payload):
+        self.response.content = json.dumps(payload).encode()
+
+    def test_fetch_games_parses_scoreboard(self):
+        """Test that ESPN events become game snapshots."""
+        self._respond({"events": [_espn_event("401")]})
+
+        games = self.client.fetch_games(date(2025, 1, 9))
+
+        self.assertEqual(len(games), 1)
+        game = games[0]
+        self.assertEqual(game.state, GameState.LIVE)
+        self.assertEqual((game.away.abbr, game.home.abbr), ("BOS", "LAL"))
+        self.assertEqual(game.home.score, 50)
+        self.assertEqual(game.period_name, "Q2")
+        self.assertEqual(game.start_time_local, datetime(2025, 1, 10, 0, 30, tzinfo=timezone.utc))
+
+    def test_fetch_games_range_uses_one_request(self):
+        """Test that a date range is fetched with ESPN's range syntax."""
+        self._respond({"events": [_espn_event("1"), _espn_event("2")]})
+
+        games = self.client.fetch_games_range(date(2025, 1, 8), date(2025, 1, 9))
+
+        self.assertEqual(len(games), 2)
+        self.client._session.get.assert_called_once()
+        self.assertEqual(self.client._session.get.call_args.kwargs["params"], {"dates": "20250108-20250109"})
+
+    def test_status_names_map_to_states(self):
+        """Test that ESPN status names map to game states."""
+        self._respond({"events": [
+            _espn_event("1", "STATUS_POSTPONED"),
+            _espn_event("2", "STATUS_FINAL_OT", period=5),
+            _espn_event("3", "STATUS_HALFTIME"),
+        ]})
+
+        games = self.client.fetch_games(date(2025, 1, 9))
+
+        self.assertEqual([game.state for game in games], [GameState.PRE, GameState.FINAL, GameState.LIVE])
+
+    def test_fetch_teams(self):
+        """Test that teams are read from the nested ESPN teams payload."""
+        self._respond({"sports": [{"leagues": [{"teams": [
+            {"team": {"id": "13", "displayName": "Los Angeles Lakers", "abbreviation": "LAL",
+                      "color": "552583", "alternateColor": "fdb927"}},
+        ]}]}]})
+
+        teams = self.client.fetch_teams()
+
+        self.assertEqual(len(teams), 1)
+        self.assertEqual(teams[0]["abbreviation"], "LAL")
+        self.assertEqual(teams[0]["colors"]["primary"], "552583")
+
+    def test_fetch_teams_with_empty_payload(self):
+        """Test that missing or empty nesting levels yield no teams."""
+        for payload in ({}, {"sports": []}, {"sports": [{"leagues": []}]}):
+            self._respond(payload)
+            self.assertEqual(self.client.fetch_teams(), [])
+
+    def test_period_names(self):
+        """Test NBA period names for regulation, overtime and final states."""
+        self.assertEqual(self.client._format_period_name(3, GameState.LIVE), "Q3")
+        self.assertEqual(self.client._format_period_name(5, GameState.LIVE), "OT")
+        self.assertEqual(self.client._format_period_name(7, GameState.LIVE), "OT3")
+        self.assertEqual(self.client._format_period_name(4, GameState.FINAL), "Final")
+        self.assertEqual(self.client._format_period_name(6, GameState.FINAL), "Final/OT2")
+        self.assertEqual(self.client._format_period_name(1, GameState.PRE), "")
+        self.assertEqual(self.client._format_period_name(15, GameState.LIVE), "OT11")
+
+    def test_non_iso_date_falls_back(self):
+        """Test that dates outside ISO 8601 are still parsed."""
+        event = _espn_event("401", date_str="Jan 10 2025 00:30 UTC")
+        self._respond({"events": [event]})
+
+        games = self.client.fetch_games(date(2025, 1, 9))
+
+        self.assertEqual(games[0].start_time_local, datetime(2025, 1, 10, 0, 30, tzinfo=timezone.utc))
+
+
+
+class TestWNBAClient(unittest.TestCase):
+    """Test ESPN WNBA scoreboard parsing."""
+
+    def setUp(self):
+        """Set up a client with a stubbed HTTP session."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.client = WNBAClient(WNBA_LEAGUE, BASKETBALL_SPORT, cache_dir=self.temp_dir.name)
+        self.client._session = Mock()
+        self.response = self.client._session.get.return_value
+        self.response.status_code = 200
+        self.response.headers = {}
+
+    def _respond(self, payload):
+        self.response.content = json.dumps(payload).encode()
+
+    def test_fetch_games_parses_scoreboard(self):
+        """Test that the raw response body is decoded and parsed into games."""
+        event = _espn_event("401")
+        event["competitions"][0]["status"] = {
+            "period": 3, "displayClock": "2:10",
+            "type": {"state": "in", "detail": "3rd Quarter"},
+        }
+        self._respond({"events": [event]})
+
+        games = self.client.fetch_games(date(2025, 6, 1))
+
+        self.assertEqual(len(games), 1)
+        game = games[0]
+        self.assertEqual(game.event_id, "401")
+        self.assertEqual(game.state, GameState.LIVE)
+        self.assertEqual((game.away.abbr, game.home.abbr), ("BOS", "LAL"))
+        self.assertEqual(game.home.score, 50)
+        self.assertEqual(game.period_name, "Q3")
+        self.assertEqual(game.display_clock, "2:10")
+        self.assertEqual(game.status_detail, "3rd Quarter")
+
+    def test_pregame_countdown_uses_fetch_time(self):
+        """Test that seconds to start are measured from one clock read per fetch."""
+        event = _espn_event("401", date_str="2025-06-01T23:00Z")
+        event["competitions"][0]["status"] = {"type": {"state": "pre"}}
+        self._respond({"events": [event, dict(event, id="402")]})
+        now = datetime(2025, 6, 1, 22, 0, tzinfo=timezone.utc)
+
+        with patch("src.sports.leagues.wnba.datetime", wraps=datetime) as mock_datetime:
+            mock_datetime.now.return_value = now
+            games = self.client.fetch_games(date(2025, 6, 1))
+
+        self.assertEqual([game.seconds_to_start for game in games], [3600, 3600])
+        mock_datetime.now.assert_called_once_with(timezone.utc)
+
+    def test_pregame_countdown_recomputed_for_cached_games(self):
+        """Test that games reused from cache or after a 304 count down to the start."""
+        event = _espn_event("401", date_str="2025-06-01T23:00Z")
+        event["competitions"][0]["status"] = {"type": {"state": "pre"}}
+        self._respond({"events": [event]})
+        with patch("src.sports.leagues.wnba.datetime", wraps=datetime) as mock_datetime:
+            mock_datetime.now.return_value = datetime(2025, 6, 1, 21, 0, tzinfo=timezone.utc)
+            self.client.fetch_games(date(2025, 6, 1))
+
+        with patch("src.sports.clients.base.datetime", wraps=datetime) as mock_datetime:
+            mock_datetime.now.return_value = datetime(2025, 6, 1, 22, 0, tzinfo=timezone.utc)
+            cached = self.client.fetch_games(date(2025, 6, 1))
+            self.assertEqual(cached[0].seconds_to_start, 3600)
+
+            self.client._mem_cache["games_20250601"] = (0.0, cached)
+            self.response.status_code = 304
+            mock_datetime.now.return_value = datetime(2025, 6, 1, 22, 59, tzinfo=timezone.utc)
+            revalidated = self.client.fetch_games(date(2025, 6, 1))
+
+        self.assertEqual(revalidated[0].seconds_to_start, 60)
+        # Starting soon, so the restarted TTL is the short pregame one
+        self.assertLessEqual(self.client._mem_cache["games_20250601"][0] - time.monotonic(), 60)
+
+    def test_unused_scoreboard_fields_are_skipped(self):
+        """Test that only the fields the parser reads are decoded."""
+        event = _espn_event("401")
+        event["links"] = [{"href": "http://example.test"}]
+        event["broadcasts"] = [{"names": ["ION"]}]
+        self._respond({"leagues": [{"id": "59"}], "events": [event]})
+
+        with patch.object(self.client, "_parse_game", return_value=None) as parse_game:
+            self.client.fetch_games(date(2025, 6, 1))
+
+        decoded = parse_game.call_args.args[0]
+        self.assertNotIn("links", decoded)
+        self.assertEqual(decoded["broadcasts"], [{"names": ["ION"]}])
+        self.assertEqual(decoded["competitions"][0]["competitors"][0]["team"]["abbreviation"], "LAL")
+
+    def test_unexpected_shape_falls_back_to_full_decode(self):
+        """Test that a payload not matching the schema is still parsed."""
+        self._respond({"events": [_espn_event("401"), "not an event"]})
+
+        with patch.object(self.client, "_parse_game", return_value=None) as parse_game:
+            self.client.fetch_games(date(2025, 6, 1))
+
+        self.assertEqual(parse_game.call_count, 2)
+
+    def test_invalid_json_returns_empty(self):
+        """Test that an undecodable body yields no games."""
+        self.response.content = b"<html>"
+
+        with self.assertLogs("src.sports.leagues.wnba", level="ERROR"):
+            self.assertEqual(self.client.fetch_games(date(2025, 6, 1)), [])
+
+    def test_scoreboard_cached_until_ttl_expires(self):
+        """Test that repeat polls within the TTL reuse the parsed games."""
+        self._respond({"events": [_espn_event("401")]})
+
+        first = self.client.fetch_games(date(2025, 6, 1))
+        second = self.client.fetch_games(date(2025, 6, 1))
+
+        self.assertIs(first, second)
+        self.assertEqual(self.client._session.get.call_count, 1)
+
+        expiry, games = self.client._mem_cache["games_20250601"]
+        self.client._mem_cache["games_20250601"] = (0.0, games)
+        self.client.fetch_games(date(2025, 6, 1))
+
+        self.assertEqual(self.client._session.get.call_count, 2)
+
+    def test_expired_scoreboard_revalidated_with_etag(self):
+        """Test that an unchanged scoreboard is answered 304 and the parsed games reused."""
+        self._respond({"events": [_espn_event("401")]})
+        self.response.headers = {"ETag": '"v1"'}
+        first = self.client.fetch_games(date(2025, 6, 1))
+        self.client._mem_cache["games_20250601"] = (0.0, first)
+        self.response.status_code = 304
+        self.response.content = b""
+
+        second = self.client.fetch_games(date(2025, 6, 1))
+
+        self.assertIs(second, first)
+        headers = self.client._session.get.call_args.kwargs["headers"]
+        self.assertEqual(headers["If-None-Match"], '"v1"')
+
+    def test_games_served_from_disk_after_restart(self):
+        """Test that a new client reuses the saved scoreboard instead of refetching."""
+        self._respond({"events": [_espn_event("401")]})
+        self.client.fetch_games(date(2025, 6, 1))
+
+        restarted = WNBAClient(WNBA_LEAGUE, BASKETBALL_SPORT, cache_dir=self.temp_dir.name)
+        restarted._session = Mock()
+
+        self.assertEqual([game.event_id for game in restarted.fetch_games(date(2025, 6, 1))], ["401"])
+        restarted._session.get.assert_not_called()
+
+    def test_unchanged_teams_reused_across_polls(self):
+        """Test that a team is only rebuilt once its score changes."""
+        self._respond({"events": [_espn_event("401")]})
+        first = self.client.fetch_games(date(2025, 6, 1))[0]
+        self.client._mem_cache["games_20250601"] = (0.0, [first])
+        event = _espn_event("401")
+        event["competitions"][0]["competitors"][1]["score"] = "51"
+        self._respond({"events": [event]})
+
+        second = self.client.fetch_games(date(2025, 6, 1))[0]
+
+        self.assertIs(second.home, first.home)
+        self.assertIsNot(second.away, first.away)
+        self.assertEqual(second.away.score, 51)
+
+    def test_failed_fetch_is_not_cached(self):
+        """Test that an error response is retried on the next poll."""
+        self.response.content = b"<html>"
+        self.client.fetch_games(date(2025, 6, 1))
+        self._respond({"events": [_espn_event("401")]})
+
+        self.assertEqual(len(self.client.fetch_games(date(2025, 6, 1))), 1)
+
+    def test_fetch_teams(self):
+        """Test that teams are read from the ESPN teams payload."""
+        self._respond({"sports": [{"leagues": [{"teams": [
+            {"team": {"id": 17, "displayName": "Las Vegas Aces", "abbreviation": "LV",
+                      "logos": [{"href": "http://logo"}], "venue": {"fullName": "Arena"}}},
+        ]}]}]})
+
+        teams = self.client.fetch_teams()
+
+        self.assertEqual(teams[0]["id"], "17")
+        self.assertEqual(teams[0]["logo_url"], "http://logo")
+        self.assertEqual(teams[0]["venue"], "Arena")
+        self.assertIs(self.client.fetch_teams(), teams)
+        self.assertEqual(self.client._session.get.call_count, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()